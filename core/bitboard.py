@@ -0,0 +1,132 @@
+class _RowView:
+    """Read/write view of one board row so `grid[y][x]` keeps working."""
+    __slots__ = ('_board', '_base', '_size')
+
+    def __init__(self, board, y):
+        self._board = board
+        self._base = y * board.size
+        self._size = board.size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return list(self._board.cells[self._base:self._base + self._size][x])
+        return self._board.cells[self._base + x]
+
+    def __setitem__(self, x, player):
+        self._board._set(self._base + x, player)
+
+    def __iter__(self):
+        return iter(self._board.cells[self._base:self._base + self._size])
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class BitBoard:
+    """Compact board backend.
+
+    Cells are stored in a flat bytearray (index = y * size + x) and mirrored in
+    one integer bitboard per player. A running stone count and the set of empty
+    indices are kept up to date, so occupancy queries do not rescan the board.
+    `grid` is a list of row views, so code written against `Board.grid` (the
+    players, `Game` and the GUI) works unchanged, including writes.
+    """
+
+    def __init__(self, size=15):
+        self.size = size
+        self.reset()
+
+    def reset(self):
+        n = self.size * self.size
+        self.cells = bytearray(n)
+        self.bits = [0, 0, 0]  # index by player; slot 0 unused
+        self.stone_count = 0
+        self.empty = set(range(n))
+        self.grid = [_RowView(self, y) for y in range(self.size)]
+
+    @classmethod
+    def from_grid(cls, grid):
+        board = cls(len(grid))
+        for y, row in enumerate(grid):
+            for x, v in enumerate(row):
+                if v != 0:
+                    board._set(y * board.size + x, v)
+        return board
+
+    def index(self, x, y):
+        return y * self.size + x
+
+    def get(self, x, y):
+        return self.cells[y * self.size + x]
+
+    def _set(self, i, player):
+        """Write `player` (0 to clear) at flat index i, keeping all indexes in sync."""
+        old = self.cells[i]
+        if old == player:
+            return
+        bit = 1 << i
+        if old != 0:
+            self.bits[old] &= ~bit
+            self.stone_count -= 1
+            self.empty.add(i)
+        if player != 0:
+            self.bits[player] |= bit
+            self.stone_count += 1
+            self.empty.discard(i)
+        self.cells[i] = player
+
+    def place(self, x, y, player):
+        """Place a stone for player at (x,y). Return True if placed."""
+        if 0 <= x < self.size and 0 <= y < self.size and self.cells[y * self.size + x] == 0:
+            self._set(y * self.size + x, player)
+            return True
+        return False
+
+    def remove(self, x, y):
+        """Clear (x,y). Return True if a stone was removed."""
+        if 0 <= x < self.size and 0 <= y < self.size and self.cells[y * self.size + x] != 0:
+            self._set(y * self.size + x, 0)
+            return True
+        return False
+
+    @property
+    def occupied(self):
+        return self.bits[1] | self.bits[2]
+
+    def is_full(self):
+        return not self.empty
+
+    def empty_cells(self):
+        size = self.size
+        return [(i % size, i // size) for i in sorted(self.empty)]
+
+    # Line views: copies of the cells along a row, column or diagonal.
+    def row(self, y):
+        return self.cells[y * self.size:(y + 1) * self.size]
+
+    def column(self, x):
+        return self.cells[x::self.size]
+
+    def diagonal(self, x, y):
+        """Cells on the (1, 1) diagonal through (x,y), from top-left to bottom-right."""
+        k = min(x, y)
+        sx, sy = x - k, y - k
+        length = self.size - max(sx, sy)
+        start = sy * self.size + sx
+        return self.cells[start:start + (length - 1) * (self.size + 1) + 1:self.size + 1]
+
+    def anti_diagonal(self, x, y):
+        """Cells on the (-1, 1) diagonal through (x,y), from top-right to bottom-left."""
+        k = min(self.size - 1 - x, y)
+        sx, sy = x + k, y - k
+        length = min(sx + 1, self.size - sy)
+        start = sy * self.size + sx
+        return self.cells[start:start + (length - 1) * (self.size - 1) + 1:self.size - 1]
+
+    def to_lists(self):
+        """Return a plain list-of-lists copy of the board."""
+        size = self.size
+        return [list(self.cells[y * size:(y + 1) * size]) for y in range(size)]
@@ -1,20 +1,72 @@
+def bounding_box(grid, margin=0):
+    """
+    (x0, y0, x1, y1), inclusive, of the stones on grid widened by margin and
+    clipped to the board, or None for an empty board. Lets whole-board scans
+    visit only the active region, which on large boards is a small part of it.
+    """
+    size = len(grid)
+    x0 = y0 = size
+    x1 = y1 = -1
+    for y, row in enumerate(grid):
+        if any(row):
+            cells = bytes(row)  # strip() finds the first and last stone at C speed
+            x0 = min(x0, len(cells) - len(cells.lstrip(b'\0')))
+            x1 = max(x1, len(cells.rstrip(b'\0')) - 1)
+            if y1 < 0:
+                y0 = y
+            y1 = y
+    if y1 < 0:
+        return None
+    return max(0, x0 - margin), max(0, y0 - margin), min(size - 1, x1 + margin), min(size - 1, y1 + margin)
+
+
+def stones(grid):
+    """(x, y, player) for every stone on grid in row-major order, scanning only its bounding box."""
+    box = bounding_box(grid)
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    for y in range(y0, y1 + 1):
+        row = grid[y]
+        for x in range(x0, x1 + 1):
+            v = row[x]
+            if v:
+                yield x, y, v
+
+
 class Board:
+    """
+    size x size grid of 0 (empty), 1 and 2, with a running stone count so
+    is_full() is O(1). place() and remove() are the only supported mutators:
+    writing grid cells directly leaves stone_count (and is_full()) stale.
+    """
+
     def __init__(self, size=15):
         self.size = size
         self.reset()
 
     def reset(self):
         self.grid = [[0] * self.size for _ in range(self.size)]
+        self.stone_count = 0
 
     def place(self, x, y, player):
         """Place a stone for player at (x,y). Return True if placed."""
         if 0 <= x < self.size and 0 <= y < self.size and self.grid[y][x] == 0:
             self.grid[y][x] = player
+            self.stone_count += 1
+            return True
+        return False
+
+    def remove(self, x, y):
+        """Clear (x,y). Return True if a stone was removed."""
+        if 0 <= x < self.size and 0 <= y < self.size and self.grid[y][x] != 0:
+            self.grid[y][x] = 0
+            self.stone_count -= 1
             return True
         return False
 
     def is_full(self):
-        return all(self.grid[y][x] != 0 for y in range(self.size) for x in range(self.size))
+        return self.stone_count == self.size * self.size
 
     def empty_cells(self):
         return [(x, y) for y in range(self.size) for x in range(self.size) if self.grid[y][x] == 0]
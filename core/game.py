@@ -1,39 +1,60 @@
 from .board import Board
-from .rule import check_win
+from .record import RESULT_DRAW
+from .rule import RunTable, get_rules
 
 
 class Game:
-    def __init__(self, size=15):
+    def __init__(self, size=15, board_cls=Board, recorder=None, rules=None):
+        """board_cls selects the board backend, e.g. core.bitboard.BitBoard.
+        recorder: core.record.GameWriter that every game is streamed to.
+        rules: rule set name ('freestyle', 'standard', 'renju') or core.rule.Rules."""
         self.size = size
-        self.board = Board(size)
+        self.rules = get_rules(rules)
+        self.recorder = recorder
+        self.board = board_cls(size)
+        self.runs = RunTable(size)
         self.current_player = 1
         self.winner = 0
         self.win_line = None
         self.last_move = None
+        if recorder is not None:
+            recorder.begin(size, self.current_player, self.rules)
 
     def reset(self, starting_player=1):
+        if self.recorder is not None:
+            self.recorder.begin(self.size, starting_player, self.rules)
         self.board.reset()
+        self.runs.reset()
         self.current_player = starting_player
         self.winner = 0
         self.win_line = None
         self.last_move = None
 
     def play_move(self, x, y):
-        """Attempt to place current_player at (x,y).
+        """Attempt to place current_player at (x,y); forbidden moves are refused.
         Returns (placed:bool, won:bool)."""
         if self.winner != 0:
             return False, False
         placed = self.board.place(x, y, self.current_player)
         if not placed:
             return False, False
+        if self.rules.restricted and self.rules.forbidden(self.board.grid, x, y, self.current_player):
+            self.board.remove(x, y)
+            return False, False
         # determine if this placement produced a winning contiguous line
-        from .rule import get_win_line
-        win_line = get_win_line(self.board.grid, x, y, self.current_player)
+        self.runs.place(x, y, self.current_player)
+        win_line = self.rules.win_line(self.runs, x, y, self.current_player)
         self.last_move = (x, y)
+        if self.recorder is not None:
+            self.recorder.move(x, y)
         if win_line:
             self.winner = self.current_player
             self.win_line = win_line
+            if self.recorder is not None:
+                self.recorder.finish(self.winner)
             return True, True
+        if self.recorder is not None and self.board.is_full():
+            self.recorder.finish(RESULT_DRAW)
         # switch turn
         self.current_player = 3 - self.current_player
         return True, False
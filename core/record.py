@@ -0,0 +1,250 @@
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+from .board import Board
+from .rule import get_rules
+
+# Archive layout: MAGIC, then records appended one after another. A record is
+#   b'G', board size, first player, rules, one (x, y) byte pair per move, END, result
+# Coordinates are below 255, so END never occurs inside the move list and a
+# record can be streamed move by move before its result is known.
+MAGIC = b'GMKREC2\n'
+MAGIC_V1 = b'GMKREC1\n'  # older archives: records without the rules byte, read as freestyle
+START = b'G'
+RULE_NAMES = ('freestyle', 'standard', 'renju')  # rules byte -> core.rule name
+END = 0xFF
+RESULT_DRAW = 0          # 1 and 2 are the winning player
+RESULT_UNFINISHED = 3
+
+# Index sidecar (<archive>.idx): magic, archive bytes covered, then one u64 offset per record
+INDEX_MAGIC = b'GMKIDX1\n'
+INDEX_HEADER = struct.Struct('<8sQ')
+OFFSET = struct.Struct('<Q')
+
+GameRecord = namedtuple('GameRecord', 'size first_player moves result rules')
+
+
+class GameWriter:
+    """
+    Append-only writer for game archives.
+    Moves are written as they are played (begin/move/finish), which is how
+    Game(recorder=...) uses it; write_game() stores a whole game at once. A
+    record is only started by its first move, so games without moves leave
+    no trace. If the process dies mid-game only the record's end is missing:
+    readers skip such a trailing partial record, and a writer reopening the
+    archive cuts it off before appending. One writer per file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        else:
+            data = _open_map(path)
+            header = _header_size(data, path)
+            complete = _complete_length(data)
+            data.close()
+            if header != HEADER_SIZE:
+                self.file.close()
+                raise ValueError(f"{path}: older archive version; record new games to a new file")
+            if complete < self.file.tell():
+                self.file.truncate(complete)
+        self.header = None  # record header not yet written for the current game
+        self.in_game = False
+        self.moves = 0
+
+    def begin(self, size, first_player=1, rules=None):
+        """Start a new game; an unfinished previous one is closed as RESULT_UNFINISHED.
+        rules: rule set name or core.rule.Rules the game is played under (freestyle if None)."""
+        self.finish(RESULT_UNFINISHED)
+        if not 0 < size < END:
+            raise ValueError(f"board size {size} cannot be recorded")
+        name = get_rules(rules).name
+        if name not in RULE_NAMES:
+            raise ValueError(f"rules {name!r} cannot be recorded")
+        self.header = START + bytes((size, first_player, RULE_NAMES.index(name)))
+        self.in_game = True
+        self.moves = 0
+
+    def move(self, x, y):
+        if self.moves == 0:
+            self.file.write(self.header)
+        self.file.write(bytes((x, y)))
+        self.moves += 1
+
+    def finish(self, result):
+        """End the current game with result (winner, RESULT_DRAW or RESULT_UNFINISHED)."""
+        if self.in_game and self.moves:
+            self.file.write(bytes((END, result)))
+            self.file.flush()
+        self.in_game = False
+
+    def write_game(self, size, first_player, moves, result, rules=None):
+        self.begin(size, first_player, rules)
+        for x, y in moves:
+            self.move(x, y)
+        self.finish(result)
+
+    def close(self):
+        self.finish(RESULT_UNFINISHED)
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _open_map(path):
+    """Read-only mmap of path, or None for an empty file."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# Record bytes before the first move: START, size, first player, rules
+HEADER_SIZE = 4
+
+
+def _header_size(data, path):
+    """Record header size of the archive's version (HEADER_SIZE, or one less for MAGIC_V1)."""
+    if data is not None and data[:len(MAGIC)] == MAGIC:
+        return HEADER_SIZE
+    if data is not None and data[:len(MAGIC_V1)] == MAGIC_V1:
+        return HEADER_SIZE - 1
+    raise ValueError(f"{path}: not a game archive")
+
+
+def _complete_length(data):
+    """Length of the archive up to the end of its last complete record."""
+    # END only ever occurs as a record terminator, and is followed by the result
+    end = data.rfind(bytes((END,)))
+    if end == len(data) - 1:
+        end = data.rfind(bytes((END,)), 0, end)  # crashed between END and the result
+    return end + 2 if end >= 0 else len(MAGIC)
+
+
+def _parse(data, pos, header=HEADER_SIZE):
+    """(record, next position) for the record at pos, or (None, pos) if it is incomplete."""
+    end = data.find(bytes((END,)), pos + header)
+    if data[pos:pos + 1] != START or end < 0 or end + 1 >= len(data):
+        return None, pos
+    rules = RULE_NAMES[data[pos + 3]] if header == HEADER_SIZE else 'freestyle'
+    raw = data[pos + header:end]
+    moves = list(zip(raw[::2], raw[1::2]))
+    return GameRecord(data[pos + 1], data[pos + 2], moves, data[end + 1], rules), end + 2
+
+
+def _count_below(f, limit):
+    """Number of leading index offsets below limit (offsets past it were never committed)."""
+    lo, hi = 0, (os.fstat(f.fileno()).st_size - INDEX_HEADER.size) // OFFSET.size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        f.seek(INDEX_HEADER.size + mid * OFFSET.size)
+        if OFFSET.unpack(f.read(OFFSET.size))[0] < limit:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def read_games(path):
+    """Yield every complete GameRecord in the archive, in order, without loading the file."""
+    data = _open_map(path)
+    header = _header_size(data, path)
+    try:
+        pos = len(MAGIC)
+        while pos < len(data):
+            record, pos = _parse(data, pos, header)
+            if record is None:
+                return
+            yield record
+    finally:
+        data.close()
+
+
+def replay(record, board_cls=Board):
+    """A Game with the record's moves played under the record's rules."""
+    from .game import Game
+    game = Game(record.size, board_cls, rules=record.rules)
+    game.reset(record.first_player)
+    for x, y in record.moves:
+        game.play_move(x, y)
+    return game
+
+
+class GameArchive:
+    """
+    Random access to the records of an archive: archive[i] -> GameRecord.
+    Record offsets live in a sidecar index file (<path>.idx) that is memory
+    mapped; it is built on first use and extended when the archive has grown,
+    so opening a large archive only scans the records added since.
+    """
+
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + '.idx'
+        self.data = _open_map(path)
+        self.header = _header_size(self.data, path)
+        self.count = self._update_index()
+        self.offsets = _open_map(self.index_path)
+
+    def _update_index(self):
+        """Bring the sidecar index up to date; returns the number of indexed records."""
+        covered, count = len(MAGIC), 0
+        try:
+            with open(self.index_path, 'rb') as f:
+                magic, covered = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC or covered > len(self.data):
+                    raise ValueError
+                count = _count_below(f, covered)
+        except (OSError, ValueError, struct.error):
+            covered, count = len(MAGIC), 0
+            with open(self.index_path, 'wb') as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, covered))
+        if covered == len(self.data):
+            return count
+        offsets = []
+        pos = covered
+        while pos < len(self.data):
+            record, end = _parse(self.data, pos, self.header)
+            if record is None:
+                break
+            offsets.append(pos)
+            pos = end
+        with open(self.index_path, 'r+b') as f:
+            f.seek(INDEX_HEADER.size + count * OFFSET.size)
+            f.write(b''.join(OFFSET.pack(o) for o in offsets))
+            f.truncate()
+            f.seek(0)
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, pos))
+        return count + len(offsets)
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        offset = OFFSET.unpack_from(self.offsets, INDEX_HEADER.size + i * OFFSET.size)[0]
+        return _parse(self.data, offset, self.header)[0]
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+    def close(self):
+        self.data.close()
+        self.offsets.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
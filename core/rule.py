@@ -1,3 +1,8 @@
+from .board import stones
+
+DIRECTIONS = [(1, 0), (0, 1), (1, 1), (1, -1)]
+
+
 def check_win(grid, x, y, player, win_len=5):
     """Return True if placing `player` at (x,y) on `grid` makes `player` have win_len in a row."""
     size = len(grid)
@@ -14,11 +19,6 @@ def check_win(grid, x, y, player, win_len=5):
                 else:
                     break
         if count >= win_len:
-            # Debug: report winning detection (useful when investigating false positives)
-            try:
-                print(f"check_win: player={player} win at {(x,y)} dir={(dx,dy)} count={count}")
-            except Exception:
-                pass
             return True
     return False
 
@@ -51,3 +51,306 @@ def get_win_line(grid, x, y, player, win_len=5):
         if len(coords) >= win_len:
             return coords
     return None
+
+
+_links = {}
+
+
+def _neighbour_links(size):
+    """(next, prev) per direction: flat index of the neighbour along +d / -d, or -1; shared per size."""
+    links = _links.get(size)
+    if links is not None:
+        return links
+    n = size * size
+    nexts, prevs = [], []
+    for dx, dy in DIRECTIONS:
+        nxt = [-1] * n
+        prv = [-1] * n
+        for y in range(size):
+            for x in range(size):
+                i = y * size + x
+                if 0 <= x + dx < size and 0 <= y + dy < size:
+                    nxt[i] = (y + dy) * size + x + dx
+                if 0 <= x - dx < size and 0 <= y - dy < size:
+                    prv[i] = (y - dy) * size + x - dx
+        nexts.append(nxt)
+        prevs.append(prv)
+    links = _links[size] = (nexts, prevs)
+    return links
+
+
+class RunTable:
+    """Incrementally maintained run lengths for fast win detection.
+
+    For every cell, direction and player the table stores how many of that
+    player's stones lie contiguously just after the cell (`fwd`) and just
+    before it (`bwd`). Placing or removing a stone only touches the runs that
+    end next to it, so "does this move make five" and "does this cell block a
+    five" are table lookups instead of directional walks.
+    """
+
+    def __init__(self, size=15):
+        self.size = size
+        # _next[d][i] / _prev[d][i]: neighbour of flat index i along +d / -d, or -1
+        self._next, self._prev = _neighbour_links(size)
+        self.reset()
+
+    def reset(self):
+        n = self.size * self.size
+        self.cells = [0] * n
+        # fwd[player][d][i] / bwd[player][d][i]; slot 0 unused
+        self.fwd = [None] + [[[0] * n for _ in DIRECTIONS] for _ in (1, 2)]
+        self.bwd = [None] + [[[0] * n for _ in DIRECTIONS] for _ in (1, 2)]
+
+    @classmethod
+    def from_grid(cls, grid):
+        table = cls(len(grid))
+        for x, y, v in stones(grid):
+            table.place(x, y, v)
+        return table
+
+    def _update(self, i, player, placed):
+        cells = self.cells
+        for d in range(4):
+            fwd = self.fwd[player][d]
+            bwd = self.bwd[player][d]
+            ahead = fwd[i] + 1 if placed else 0
+            behind = bwd[i] + 1 if placed else 0
+            # cells behind i see i (and the run after it) ahead of them
+            j, k = self._prev[d][i], 0
+            while j != -1:
+                fwd[j] = k + ahead
+                if cells[j] != player:
+                    break
+                j, k = self._prev[d][j], k + 1
+            j, k = self._next[d][i], 0
+            while j != -1:
+                bwd[j] = k + behind
+                if cells[j] != player:
+                    break
+                j, k = self._next[d][j], k + 1
+
+    def place(self, x, y, player):
+        i = y * self.size + x
+        self.cells[i] = player
+        self._update(i, player, True)
+
+    def remove(self, x, y):
+        i = y * self.size + x
+        player = self.cells[i]
+        if player == 0:
+            return
+        self.cells[i] = 0
+        self._update(i, player, False)
+
+    def run_length(self, x, y, player, d):
+        """Length of player's run through (x,y) along DIRECTIONS[d], counting (x,y) itself."""
+        i = y * self.size + x
+        return self.fwd[player][d][i] + self.bwd[player][d][i] + 1
+
+    def max_run(self, x, y, player):
+        i = y * self.size + x
+        fwd = self.fwd[player]
+        bwd = self.bwd[player]
+        return max(fwd[d][i] + bwd[d][i] for d in range(4)) + 1
+
+    def makes_five(self, x, y, player, win_len=5):
+        """True if a `player` stone at (x,y) is part of a run of at least win_len."""
+        i = y * self.size + x
+        fwd = self.fwd[player]
+        bwd = self.bwd[player]
+        for d in range(4):
+            if fwd[d][i] + bwd[d][i] + 1 >= win_len:
+                return True
+        return False
+
+    def blocks_five(self, x, y, player, win_len=5):
+        """True if `player` playing (x,y) stops the opponent from making win_len there."""
+        return self.makes_five(x, y, 3 - player, win_len)
+
+    def win_line(self, x, y, player, win_len=5):
+        """Table-driven equivalent of get_win_line."""
+        i = y * self.size + x
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            ahead = self.fwd[player][d][i]
+            behind = self.bwd[player][d][i]
+            if ahead + behind + 1 >= win_len:
+                return [(x + k * dx, y + k * dy) for k in range(-behind, ahead + 1)]
+        return None
+
+
+# Line windows for the rule tables: the 11 cells k = -5..5 along a direction
+# through a cell, each coded 0 = empty, 1 = own stone, 2 = opponent or off board.
+# The centre (k = 0) is the stone being judged.
+LINE_REACH = 5
+_EMPTY, _OWN, _BLOCKED = 0, 1, 2
+
+_line_info = {}
+
+
+def _run_through_centre(cells):
+    centre = LINE_REACH
+    lo = centre
+    while lo > 0 and cells[lo - 1] == _OWN:
+        lo -= 1
+    hi = centre
+    while hi < len(cells) - 1 and cells[hi + 1] == _OWN:
+        hi += 1
+    return lo, hi
+
+
+def _classify_line(cells):
+    """(run length, fours, open three) for the own stone at the centre of an 11-cell window.
+
+    fours counts distinct ways to complete exactly five through the centre
+    (an open four is one four; split shapes like X_XXX_X count two); the open
+    three flag means one more stone makes a straight four (_XXXX_ whose both
+    completions are exact fives). The recursive Renju refinement (the
+    straight-four point must itself be legal) is not applied.
+    """
+    lo, hi = _run_through_centre(cells)
+    run = hi - lo + 1
+    cells = list(cells)
+    fours = set()
+    for e in range(1, 2 * LINE_REACH):
+        if cells[e] != _EMPTY:
+            continue
+        cells[e] = _OWN
+        a, b = _run_through_centre(cells)
+        if b - a + 1 == 5:
+            fours.add(frozenset(range(a, b + 1)) - {e})
+        cells[e] = _EMPTY
+    three = False
+    if not fours and run < 5:
+        for e in range(1, 2 * LINE_REACH):
+            if cells[e] != _EMPTY:
+                continue
+            cells[e] = _OWN
+            a, b = _run_through_centre(cells)
+            if (b - a + 1 == 4 and a >= 2 and b <= len(cells) - 3
+                    and cells[a - 1] == _EMPTY and cells[b + 1] == _EMPTY
+                    and cells[a - 2] != _OWN and cells[b + 2] != _OWN):
+                three = True
+            cells[e] = _EMPTY
+            if three:
+                break
+    return run, len(fours), three
+
+
+def line_info(code):
+    """Memoised _classify_line for a base-3 window code (see line_code)."""
+    info = _line_info.get(code)
+    if info is None:
+        cells = []
+        c = code
+        for _ in range(2 * LINE_REACH + 1):
+            cells.append(c % 3)
+            c //= 3
+        info = _line_info[code] = _classify_line(cells)
+    return info
+
+
+def line_code(grid, x, y, dx, dy, player):
+    """Base-3 code of the 11-cell window through (x,y) with player's stone at the centre."""
+    size = len(grid)
+    code = 0
+    for k in range(LINE_REACH, -LINE_REACH - 1, -1):
+        if k == 0:
+            v = _OWN
+        else:
+            nx, ny = x + k * dx, y + k * dy
+            if 0 <= nx < size and 0 <= ny < size:
+                cell = grid[ny][nx]
+                v = _EMPTY if cell == 0 else (_OWN if cell == player else _BLOCKED)
+            else:
+                v = _BLOCKED
+        code = code * 3 + v
+    return code
+
+
+class Rules:
+    """Freestyle gomoku: five or more in a row wins, no forbidden moves.
+
+    A rule set judges a stone already recorded in a RunTable (wins, win_line)
+    and whether a move is forbidden (forbidden). `restricted` is False when
+    no move is ever forbidden, so callers can skip the check.
+    """
+    name = 'freestyle'
+    restricted = False
+
+    def wins(self, runs, x, y, player):
+        return runs.makes_five(x, y, player)
+
+    def win_line(self, runs, x, y, player):
+        return runs.win_line(x, y, player)
+
+    def forbidden(self, grid, x, y, player):
+        """True if player may not play the empty cell (x,y)."""
+        return False
+
+
+class StandardRules(Rules):
+    """Standard gomoku: exactly five wins; overlines do not count for either side."""
+    name = 'standard'
+
+    def _exact(self, player):
+        return True
+
+    def wins(self, runs, x, y, player):
+        return self.win_line(runs, x, y, player) is not None
+
+    def win_line(self, runs, x, y, player):
+        exact = self._exact(player)
+        i = y * runs.size + x
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            ahead = runs.fwd[player][d][i]
+            behind = runs.bwd[player][d][i]
+            length = ahead + behind + 1
+            if length == 5 or (length > 5 and not exact):
+                return [(x + k * dx, y + k * dy) for k in range(-behind, ahead + 1)]
+        return None
+
+
+class RenjuRules(StandardRules):
+    """Renju: black needs exactly five and may not play a double three, a
+    double four or an overline (unless the move also makes exactly five);
+    white wins with five or more and has no restrictions.
+
+    Forbidden moves are judged from precomputed line tables: each of the four
+    11-cell windows through the move is coded in base 3 and looked up in
+    line_info(), so a check costs four table lookups.
+    """
+    name = 'renju'
+    restricted = True
+
+    def _exact(self, player):
+        return player == 1
+
+    def forbidden(self, grid, x, y, player):
+        if player != 1:
+            return False
+        fours = threes = 0
+        overline = False
+        for dx, dy in DIRECTIONS:
+            run, f, three = line_info(line_code(grid, x, y, dx, dy, player))
+            if run == 5:
+                return False  # exactly five wins regardless
+            if run > 5:
+                overline = True
+            fours += f
+            threes += three
+        return overline or fours >= 2 or threes >= 2
+
+
+RULES = {rules.name: rules for rules in (Rules(), StandardRules(), RenjuRules())}
+
+
+def get_rules(rules=None):
+    """A Rules instance from a name in RULES, an instance, or None (freestyle)."""
+    if rules is None:
+        return RULES['freestyle']
+    if isinstance(rules, str):
+        if rules not in RULES:
+            raise ValueError(f"unknown rules {rules!r}; choose from {', '.join(RULES)}")
+        return RULES[rules]
+    return rules
@@ -0,0 +1,44 @@
+import random
+
+from .board import stones
+
+# Fixed seed so keys are identical in every process (worker pools, on-disk tables).
+ZOBRIST_SEED = 0x6F6D6F6B75
+
+
+class Zobrist:
+    """Random 64-bit keys per (cell, player) for incremental position hashing.
+
+    The key of a position is the XOR of the keys of its stones, so placing or
+    removing a stone is a single XOR via toggle().
+    """
+
+    def __init__(self, size=15, seed=ZOBRIST_SEED):
+        rng = random.Random(seed)
+        self.size = size
+        # keys[player][y * size + x]; slot 0 unused
+        self.keys = [None] + [[rng.getrandbits(64) for _ in range(size * size)] for _ in (1, 2)]
+        # side[player] distinguishes searches run from each player's point of view
+        self.side = [0, rng.getrandbits(64), rng.getrandbits(64)]
+
+    def hash_grid(self, grid):
+        key = 0
+        size = self.size
+        for x, y, v in stones(grid):
+            key ^= self.keys[v][y * size + x]
+        return key
+
+    def toggle(self, key, x, y, player):
+        """Return key with player's stone at (x,y) added or removed."""
+        return key ^ self.keys[player][y * self.size + x]
+
+
+_tables = {}
+
+
+def zobrist_for(size):
+    """Shared Zobrist table for a board size."""
+    table = _tables.get(size)
+    if table is None:
+        table = _tables[size] = Zobrist(size)
+    return table
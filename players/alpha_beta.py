@@ -1,5 +1,10 @@
 import random
-from core.rule import get_win_line
+from core.board import stones
+from .frontier import CandidateFrontier
+from .parallel import PARALLEL_TT_MB, parallel_search_root
+from .search import SearchContext, order_first
+from .stats import phase
+from .transposition import TranspositionTable
 
 
 def count_in_direction(grid, x, y, dx, dy, player):
@@ -21,151 +26,193 @@ def evaluate(grid, player, opponent):
     Emphasize both attacking and defending.
     """
     score = 0
-    size = len(grid)
     directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
     
-    for y in range(size):
-        for x in range(size):
-            if grid[y][x] == player:
-                # Evaluate all directions from this player piece
-                for dx, dy in directions:
-                    c_forward = count_in_direction(grid, x, y, dx, dy, player)
-                    c_backward = count_in_direction(grid, x, y, -dx, -dy, player)
-                    total = c_forward + c_backward + 1
-                    
-                    # Score based on line length - aggressive evaluation
-                    if total >= 5:
-                        score += 100000
-                    elif total == 4:
-                        score += 15000  # increased from 10000
-                    elif total == 3:
-                        score += 1000   # increased from 500
-                    elif total == 2:
-                        score += 100    # increased from 50
-                    elif total == 1:
-                        score += 10
-                        
-            elif grid[y][x] == opponent:
-                # DEFENSIVE: Heavily penalize opponent's formations
-                for dx, dy in directions:
-                    c_forward = count_in_direction(grid, x, y, dx, dy, opponent)
-                    c_backward = count_in_direction(grid, x, y, -dx, -dy, opponent)
-                    total = c_forward + c_backward + 1
+    for x, y, v in stones(grid):
+        if v == player:
+            # Evaluate all directions from this player piece
+            for dx, dy in directions:
+                c_forward = count_in_direction(grid, x, y, dx, dy, player)
+                c_backward = count_in_direction(grid, x, y, -dx, -dy, player)
+                total = c_forward + c_backward + 1
+                
+                # Score based on line length - aggressive evaluation
+                if total >= 5:
+                    score += 100000
+                elif total == 4:
+                    score += 15000  # increased from 10000
+                elif total == 3:
+                    score += 1000   # increased from 500
+                elif total == 2:
+                    score += 100    # increased from 50
+                elif total == 1:
+                    score += 10
                     
-                    # Much higher penalty to prioritize blocking opponent threats
-                    if total >= 5:
-                        score -= 150000  # increased from 100000
-                    elif total == 4:
-                        score -= 25000   # heavily increased from 10000
-                    elif total == 3:
-                        score -= 1500    # increased from 500
-                    elif total == 2:
-                        score -= 150     # increased from 50
-                    elif total == 1:
-                        score -= 10
+        elif v == opponent:
+            # DEFENSIVE: Heavily penalize opponent's formations
+            for dx, dy in directions:
+                c_forward = count_in_direction(grid, x, y, dx, dy, opponent)
+                c_backward = count_in_direction(grid, x, y, -dx, -dy, opponent)
+                total = c_forward + c_backward + 1
+                
+                # Much higher penalty to prioritize blocking opponent threats
+                if total >= 5:
+                    score -= 150000  # increased from 100000
+                elif total == 4:
+                    score -= 25000   # heavily increased from 10000
+                elif total == 3:
+                    score -= 1500    # increased from 500
+                elif total == 2:
+                    score -= 150     # increased from 50
+                elif total == 1:
+                    score -= 10
     
     return score
 
 
-def get_candidates(grid, player, opponent, limit=12):
+def get_candidates(grid, player, opponent, limit=12, frontier=None):
     """
     Get the most promising candidate moves.
-    Prioritizes moves near existing pieces.
+    Prioritizes moves near existing pieces (closer and more crowded first).
+    frontier: CandidateFrontier kept in step with grid; built if omitted.
     """
-    size = len(grid)
-    candidates = set()
-    
-    # Collect empty cells adjacent to existing pieces
-    for y in range(size):
-        for x in range(size):
-            if grid[y][x] != 0:
-                # Add neighbors
-                for dy in range(-2, 3):
-                    for dx in range(-2, 3):
-                        nx, ny = x + dx, y + dy
-                        if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] == 0:
-                            candidates.add((nx, ny))
-    
-    # If no candidates (empty board), start from center
-    if not candidates:
-        center = size // 2
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                nx, ny = center + dx, center + dy
-                if 0 <= nx < size and 0 <= ny < size:
-                    candidates.add((nx, ny))
-    
-    return list(candidates)[:limit]
+    if frontier is None:
+        frontier = CandidateFrontier.from_grid(grid)
+    return frontier.candidates(limit)
 
 
-def alphabeta(grid, x, y, depth, alpha, beta, is_maximizing, player, opponent):
+def alphabeta(grid, x, y, depth, alpha, beta, is_maximizing, player, opponent, ctx=None):
     """
     Alpha-beta minimax search.
     is_maximizing: True if searching for player's best move, False for opponent.
+    ctx: SearchContext shared by the whole search; built from grid if omitted.
     """
-    size = len(grid)
+    if ctx is None:
+        ctx = SearchContext(grid)
+    ctx.tick()
+    stats = ctx.stats
+    if stats is not None:
+        stats.node(len(ctx.stack))
     current_player = player if is_maximizing else opponent
     
     # Place the move
-    grid[y][x] = current_player
+    ctx.place(x, y, current_player)
     
     # Check for immediate win
-    if get_win_line(grid, x, y, current_player):
-        grid[y][x] = 0
+    if ctx.wins(x, y, current_player):
+        ctx.remove(x, y)
         return 100000 if is_maximizing else -100000
     
+    # Transposition table: reuse results for positions reached by other move orders
+    alpha_orig, beta_orig = alpha, beta
+    cached, alpha, beta, tt_move = ctx.tt_probe(depth, alpha, beta, player)
+    if cached is not None:
+        ctx.remove(x, y)
+        return cached
+    
     # Depth limit: evaluate and return
     if depth == 0:
-        score = evaluate(grid, player, opponent)
-        grid[y][x] = 0
+        if stats is not None:
+            stats.evaluations += 1
+        if ctx.evaluator is not None:
+            score = ctx.evaluator.score(player, opponent)
+        else:
+            score = evaluate(grid, player, opponent)
+        ctx.tt_store(0, score, float('-inf'), float('inf'), None, player)
+        ctx.remove(x, y)
         return score
     
+    best_move = None
     if is_maximizing:
         value = float('-inf')
-        candidates = get_candidates(grid, player, opponent, 8)
-        for cx, cy in candidates:
+        candidates = order_first(ctx.legal(get_candidates(grid, player, opponent, 8, ctx.frontier), player), tt_move)
+        for index, (cx, cy) in enumerate(candidates):
             if grid[cy][cx] == 0:
-                val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, False, player, opponent)
-                value = max(value, val)
+                val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, False, player, opponent, ctx)
+                if val > value:
+                    value = val
+                    best_move = (cx, cy)
                 alpha = max(alpha, value)
                 if beta <= alpha:
+                    if stats is not None:
+                        stats.cutoff(index)
                     break  # Beta cutoff
     else:
         value = float('inf')
-        candidates = get_candidates(grid, opponent, player, 8)
-        for cx, cy in candidates:
+        candidates = order_first(ctx.legal(get_candidates(grid, opponent, player, 8, ctx.frontier), opponent),
+                                 tt_move)
+        for index, (cx, cy) in enumerate(candidates):
             if grid[cy][cx] == 0:
-                val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, True, player, opponent)
-                value = min(value, val)
+                val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, True, player, opponent, ctx)
+                if val < value:
+                    value = val
+                    best_move = (cx, cy)
                 beta = min(beta, value)
                 if beta <= alpha:
+                    if stats is not None:
+                        stats.cutoff(index)
                     break  # Alpha cutoff
     
-    grid[y][x] = 0
+    ctx.tt_store(depth, value, alpha_orig, beta_orig, best_move, player)
+    ctx.remove(x, y)
     return value
 
 
-def get_move(board, player, depth=3):
+def search_candidate(grid, x, y, depth, player, alpha, beta, evaluator=None, rules=None):
+    """
+    Score one root move (x, y) with a fresh search context; run by parallel workers.
+    A fresh transposition table per move keeps results independent of scheduling.
+    """
+    ctx = SearchContext(grid, TranspositionTable(PARALLEL_TT_MB), evaluator(grid) if evaluator is not None else None,
+                        rules=rules)
+    return alphabeta(grid, x, y, depth - 1, alpha, beta, False, player, 3 - player, ctx)
+
+
+def get_move(board, player, depth=3, tt=None, evaluator=None, workers=None, listener=None, stats=None,
+             rules=None):
     """
     Find the best move for player using alpha-beta pruning.
+    tt: TranspositionTable to reuse across calls; a fresh one is made if omitted.
+    evaluator: evaluator class built from board, e.g. patterns.PatternEvaluator;
+        defaults to this module's evaluate().
+    workers: if > 1, score root moves on a shared process pool (see players.parallel).
+    listener: progress callback called with the SearchContext every few nodes.
+    stats: players.stats.SearchStats to fill in; with workers > 1 only the root
+        phases are timed.
+    rules: rule set (name or core.rule.Rules) deciding wins and forbidden moves.
     Returns (x, y) tuple or None if board is full.
     """
     opponent = 3 - player
-    candidates = get_candidates(board, player, opponent, 10)
+    with phase(stats, 'setup'):
+        if tt is None:
+            tt = TranspositionTable()
+        tt.new_search()
+        ctx = SearchContext(board, tt, evaluator(board) if evaluator is not None else None, rules=rules)
+        ctx.listener = listener
+        ctx.stats = stats
+        candidates = ctx.legal(get_candidates(board, player, opponent, 10, ctx.frontier), player)
     
     if not candidates:
         # Board is full
-        empties = [(x, y) for y in range(len(board)) for x in range(len(board)) if board[y][x] == 0]
+        empties = ctx.legal([(x, y) for y in range(len(board)) for x in range(len(board)) if board[y][x] == 0],
+                            player)
         return random.choice(empties) if empties else None
     
+    if workers is not None and workers > 1:
+        with phase(stats, 'search'):
+            best_move, _, _ = parallel_search_root(__name__, board, candidates, depth, player, workers,
+                                                   {'evaluator': evaluator, 'rules': ctx.rules.name})
+        return best_move
+    
     best_move = candidates[0]
     best_score = float('-inf')
     
-    for x, y in candidates:
-        if board[y][x] == 0:
-            score = alphabeta(board, x, y, depth - 1, float('-inf'), float('inf'), False, player, opponent)
-            if score > best_score:
-                best_score = score
-                best_move = (x, y)
+    with phase(stats, 'search'):
+        for x, y in candidates:
+            if board[y][x] == 0:
+                score = alphabeta(board, x, y, depth - 1, float('-inf'), float('inf'), False, player, opponent, ctx)
+                if score > best_score:
+                    best_score = score
+                    best_move = (x, y)
     
     return best_move
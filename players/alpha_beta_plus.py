@@ -1,5 +1,13 @@
 import random
-from core.rule import get_win_line
+import time
+from core.board import stones
+from core.rule import RunTable, get_rules
+from .frontier import CandidateFrontier
+from .parallel import PARALLEL_TT_MB, parallel_search_root
+from .search import HEURISTICS, SearchContext, SearchTimeout, order_first
+from .stats import phase
+from .threat import find_vcf, find_vct
+from .transposition import TranspositionTable
 
 
 def count_in_direction(grid, x, y, dx, dy, player):
@@ -40,7 +48,11 @@ def evaluate_line(grid, x, y, dx, dy, player, opponent):
     total = c_forward + c_backward + 1
     
     open_ends = count_open_ends(grid, x, y, dx, dy, player)
-    
+    return line_score(total, open_ends)
+
+
+def line_score(total, open_ends):
+    """Score of one stone whose line has `total` stones and `open_ends` empty neighbours."""
     # Scoring based on line length and openness - aggressive evaluation
     score = 0
     if total >= 5:
@@ -57,6 +69,12 @@ def evaluate_line(grid, x, y, dx, dy, player, opponent):
     return score
 
 
+# Weight applied to the opponent's formations so defence is preferred
+OPPONENT_WEIGHT = 1.5
+# Score of a won (or lost) position; far above anything evaluate() can return
+WIN_SCORE = 10 ** 9
+
+
 def evaluate(grid, player, opponent):
     """
     Advanced evaluation function.
@@ -64,26 +82,107 @@ def evaluate(grid, player, opponent):
     Emphasize defensive play to prevent opponent from winning.
     """
     score = 0
-    size = len(grid)
     directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
     
-    # Evaluate all positions
-    for y in range(size):
-        for x in range(size):
-            if grid[y][x] == player:
-                # Score player's formations
-                for dx, dy in directions:
-                    score += evaluate_line(grid, x, y, dx, dy, player, opponent)
-            elif grid[y][x] == opponent:
-                # MUCH heavier penalty for opponent's formations to prioritize defense
-                for dx, dy in directions:
-                    opponent_score = evaluate_line(grid, x, y, dx, dy, opponent, player)
-                    score -= opponent_score * 1.5  # increased from 1.1
+    # Evaluate all stones
+    for x, y, v in stones(grid):
+        if v == player:
+            # Score player's formations
+            for dx, dy in directions:
+                score += evaluate_line(grid, x, y, dx, dy, player, opponent)
+        elif v == opponent:
+            # MUCH heavier penalty for opponent's formations to prioritize defense
+            for dx, dy in directions:
+                opponent_score = evaluate_line(grid, x, y, dx, dy, opponent, player)
+                score -= opponent_score * OPPONENT_WEIGHT  # increased from 1.1
     
     return score
 
 
-def get_strategic_candidates(grid, player, opponent, limit=15):
+class IncrementalEvaluator:
+    """
+    Running-total version of evaluate().
+    Keeps the sum of evaluate_line over every stone of each colour and, when a
+    stone is placed or removed, rescores only the runs on the four lines through
+    that cell whose length or open ends can change.
+    check=True recomputes evaluate() on every score() call and raises
+    AssertionError on any mismatch (for testing).
+    """
+
+    def __init__(self, grid, check=False):
+        self.size = len(grid)
+        self.cells = [list(row) for row in grid]
+        self.check = check
+        self.totals = [0, 0, 0]  # indexed by colour; slot 0 unused
+        directions = [(1, 0), (0, 1), (1, 1), (1, -1)]
+        for x, y, v in stones(self.cells):
+            for dx, dy in directions:
+                self.totals[v] += evaluate_line(self.cells, x, y, dx, dy, v, 3 - v)
+
+    def _cell(self, x, y):
+        """Colour at (x,y), or None off the board."""
+        if 0 <= x < self.size and 0 <= y < self.size:
+            return self.cells[y][x]
+        return None
+
+    def _local_totals(self, x, y, dx, dy):
+        """Per-colour score of the runs along (dx,dy) that touch (x,y) or its two neighbours."""
+        cell = self._cell
+        totals = [0, 0, 0]
+        # t indexes cells (x + t*dx, y + t*dy); start at the run ending next to (x,y)
+        t = 0
+        prev = cell(x - dx, y - dy)
+        if prev:
+            t = -1
+            while cell(x + (t - 1) * dx, y + (t - 1) * dy) == prev:
+                t -= 1
+        while t <= 1:
+            v = cell(x + t * dx, y + t * dy)
+            if v is None:
+                break
+            if v == 0:
+                t += 1
+                continue
+            start = t
+            while cell(x + t * dx, y + t * dy) == v:
+                t += 1
+            length = t - start
+            before = 1 if cell(x + (start - 1) * dx, y + (start - 1) * dy) == 0 else 0
+            after = 1 if cell(x + t * dx, y + t * dy) == 0 else 0
+            if length == 1:
+                totals[v] += line_score(1, before + after)
+            else:
+                totals[v] += line_score(length, before) + line_score(length, after)
+                totals[v] += (length - 2) * line_score(length, 0)
+        return totals
+
+    def _set(self, x, y, value):
+        previous = self.cells[y][x]
+        for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1)]:
+            self.cells[y][x] = previous
+            old = self._local_totals(x, y, dx, dy)
+            self.cells[y][x] = value
+            new = self._local_totals(x, y, dx, dy)
+            self.totals[1] += new[1] - old[1]
+            self.totals[2] += new[2] - old[2]
+
+    def place(self, x, y, player):
+        self._set(x, y, player)
+
+    def remove(self, x, y):
+        self._set(x, y, 0)
+
+    def score(self, player, opponent):
+        """Same value as evaluate(grid, player, opponent) for the tracked position."""
+        score = self.totals[player] - self.totals[opponent] * OPPONENT_WEIGHT
+        if self.check:
+            expected = evaluate(self.cells, player, opponent)
+            if score != expected:
+                raise AssertionError(f"incremental score {score} != evaluate() {expected}")
+        return score
+
+
+def get_strategic_candidates(grid, player, opponent, limit=15, runs=None, frontier=None):
     """
     Get the most strategic candidate moves.
     Prioritizes:
@@ -91,40 +190,40 @@ def get_strategic_candidates(grid, player, opponent, limit=15):
     2. Moves that block opponent's win
     3. Moves that create/extend lines
     4. Moves near existing pieces
+    runs: RunTable for grid, so win/block checks are table lookups; built if omitted.
+    frontier: CandidateFrontier for grid; only its cells (empty cells within two
+        of a stone) can score, so the rest of the board is never visited.
     """
     size = len(grid)
+    if runs is None:
+        runs = RunTable.from_grid(grid)
+    if frontier is None:
+        frontier = CandidateFrontier.from_grid(grid)
     candidates = {}
     
-    # Check all empty cells
-    for y in range(size):
-        for x in range(size):
-            if grid[y][x] == 0:
-                priority = 0
-                
-                # Check if this move wins
-                grid[y][x] = player
-                if get_win_line(grid, x, y, player):
-                    priority = 1000000
-                grid[y][x] = 0
-                
-                # Check if this blocks opponent's win
-                if priority < 1000000:
-                    grid[y][x] = opponent
-                    if get_win_line(grid, x, y, opponent):
-                        priority = 900000
-                    grid[y][x] = 0
-                
-                # Check if near existing pieces
-                if priority < 900000:
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] != 0:
-                                priority += 100
-                                break
-                
-                if priority > 0:
-                    candidates[(x, y)] = priority
+    # Check empty cells near existing pieces
+    for x, y in frontier.cells_in_order():
+        priority = 0
+        
+        # Check if this move wins
+        if runs.makes_five(x, y, player):
+            priority = 1000000
+        
+        # Check if this blocks opponent's win
+        elif runs.makes_five(x, y, opponent):
+            priority = 900000
+        
+        # Check if near existing pieces
+        if priority < 900000:
+            for dy in range(-2, 3):
+                for dx in range(-2, 3):
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < size and 0 <= ny < size and grid[ny][nx] != 0:
+                        priority += 100
+                        break
+        
+        if priority > 0:
+            candidates[(x, y)] = priority
     
     # If no candidates, start from center
     if not candidates:
@@ -140,76 +239,378 @@ def get_strategic_candidates(grid, player, opponent, limit=15):
     return [pos for pos, _ in sorted_candidates[:limit]]
 
 
-def alphabeta(grid, x, y, depth, alpha, beta, is_maximizing, player, opponent):
+def alphabeta(grid, x, y, depth, alpha, beta, is_maximizing, player, opponent, ctx=None):
     """
     Alpha-beta minimax search with improved heuristics.
     is_maximizing: True if searching for player's best move, False for opponent.
+    ctx: SearchContext shared by the whole search; built from grid if omitted.
     """
-    size = len(grid)
+    if ctx is None:
+        ctx = SearchContext(grid)
+    ctx.tick()
+    stats = ctx.stats
+    if stats is not None:
+        stats.node(len(ctx.stack))
     current_player = player if is_maximizing else opponent
     
     # Place the move
-    grid[y][x] = current_player
+    ctx.place(x, y, current_player)
     
     # Check for immediate win
-    if get_win_line(grid, x, y, current_player):
-        grid[y][x] = 0
-        return 100000 if is_maximizing else -100000
+    if ctx.wins(x, y, current_player):
+        ctx.remove(x, y)
+        return WIN_SCORE if is_maximizing else -WIN_SCORE
+    
+    # Transposition table: reuse results for positions reached by other move orders
+    alpha_orig, beta_orig = alpha, beta
+    cached, alpha, beta, tt_move = ctx.tt_probe(depth, alpha, beta, player)
+    if cached is not None:
+        ctx.remove(x, y)
+        return cached
     
     # Depth limit: evaluate and return
     if depth == 0:
-        score = evaluate(grid, player, opponent)
-        grid[y][x] = 0
+        if stats is not None:
+            stats.evaluations += 1
+        if ctx.evaluator is not None:
+            score = ctx.evaluator.score(player, opponent)
+        else:
+            score = evaluate(grid, player, opponent)
+        ctx.tt_store(0, score, float('-inf'), float('inf'), None, player)
+        ctx.remove(x, y)
         return score
     
+    best_move = None
+    searched = 0
     if is_maximizing:
         value = float('-inf')
-        candidates = get_strategic_candidates(grid, player, opponent, 10)
+        candidates = get_strategic_candidates(grid, player, opponent, 10, ctx.runs, ctx.frontier)
+        candidates = ctx.order_moves(ctx.legal(candidates, player), tt_move, player)
         for cx, cy in candidates:
             if grid[cy][cx] == 0:
-                val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, False, player, opponent)
-                value = max(value, val)
+                if ctx.pvs and searched and alpha != float('-inf'):
+                    # PVS: prove the move is no better than alpha with a null window
+                    val = alphabeta(grid, cx, cy, depth - 1, alpha, alpha + 1, False, player, opponent, ctx)
+                    if alpha < val < beta:
+                        val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, False, player, opponent, ctx)
+                else:
+                    val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, False, player, opponent, ctx)
+                searched += 1
+                if val > value:
+                    value = val
+                    best_move = (cx, cy)
                 alpha = max(alpha, value)
                 if beta <= alpha:
+                    ctx.record_cutoff((cx, cy), depth)
+                    if stats is not None:
+                        stats.cutoff(searched - 1)
                     break  # Beta cutoff
     else:
         value = float('inf')
-        candidates = get_strategic_candidates(grid, opponent, player, 10)
+        candidates = get_strategic_candidates(grid, opponent, player, 10, ctx.runs, ctx.frontier)
+        candidates = ctx.order_moves(ctx.legal(candidates, opponent), tt_move, opponent)
         for cx, cy in candidates:
             if grid[cy][cx] == 0:
-                val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, True, player, opponent)
-                value = min(value, val)
+                if ctx.pvs and searched and beta != float('inf'):
+                    # PVS: prove the move is no better than beta with a null window
+                    val = alphabeta(grid, cx, cy, depth - 1, beta - 1, beta, True, player, opponent, ctx)
+                    if alpha < val < beta:
+                        val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, True, player, opponent, ctx)
+                else:
+                    val = alphabeta(grid, cx, cy, depth - 1, alpha, beta, True, player, opponent, ctx)
+                searched += 1
+                if val < value:
+                    value = val
+                    best_move = (cx, cy)
                 beta = min(beta, value)
                 if beta <= alpha:
+                    ctx.record_cutoff((cx, cy), depth)
+                    if stats is not None:
+                        stats.cutoff(searched - 1)
                     break  # Alpha cutoff
     
-    grid[y][x] = 0
+    ctx.tt_store(depth, value, alpha_orig, beta_orig, best_move, player)
+    ctx.remove(x, y)
     return value
 
 
-def get_move(board, player, depth=4):
+# Half-width of the root aspiration window around the previous iteration's score
+ASPIRATION_WINDOW = 2000
+
+
+def search_root(ctx, candidates, depth, player, opponent, window=None):
     """
-    Find the best move for player using improved alpha-beta pruning.
-    Uses stronger heuristics and deeper search.
-    Returns (x, y) tuple or None if board is full.
+    Score every root candidate with alphabeta of the given depth.
+    Without PVS each move gets its own full (or `window`) search; with PVS the
+    best score so far becomes alpha and later moves are first tried with a
+    null window. Returns (best_move, best_score, scores) where scores maps
+    move -> score (an upper bound for moves refuted by a null window).
     """
-    opponent = 3 - player
-    candidates = get_strategic_candidates(board, player, opponent, 12)
-    
-    if not candidates:
-        # Board is full
-        empties = [(x, y) for y in range(len(board)) for x in range(len(board)) if board[y][x] == 0]
-        return random.choice(empties) if empties else None
-    
+    board = ctx.grid
     best_move = candidates[0]
     best_score = float('-inf')
-    
-    # Search with iterative deepening and move ordering
+    scores = {}
+    alpha, beta = window if window is not None else (float('-inf'), float('inf'))
     for x, y in candidates:
         if board[y][x] == 0:
-            score = alphabeta(board, x, y, depth - 1, float('-inf'), float('inf'), False, player, opponent)
+            if ctx.pvs and scores and alpha != float('-inf'):
+                score = alphabeta(board, x, y, depth - 1, alpha, alpha + 1, False, player, opponent, ctx)
+                if alpha < score < beta:
+                    score = alphabeta(board, x, y, depth - 1, alpha, beta, False, player, opponent, ctx)
+            else:
+                score = alphabeta(board, x, y, depth - 1, alpha, beta, False, player, opponent, ctx)
+            scores[(x, y)] = score
             if score > best_score:
                 best_score = score
                 best_move = (x, y)
-    
-    return best_move
+            if ctx.pvs:
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break  # aspiration window failed high; caller re-searches
+    return best_move, best_score, scores
+
+
+def forced_move(ctx, candidates, player):
+    """
+    A candidate that makes five for player, else one that stops the opponent's
+    five, else None. search_root scores a root cell by the opponent's stone
+    on it (see alphabeta), so it cannot see that a cell must be taken.
+    """
+    for mover in (player, 3 - player):
+        for x, y in candidates:
+            if ctx.rules.wins(ctx.runs, x, y, mover):
+                return x, y
+    return None
+
+
+def search_candidate(grid, x, y, depth, player, alpha, beta, evaluator=IncrementalEvaluator,
+                     heuristics=HEURISTICS, rules=None):
+    """
+    Score one root move (x, y) with a fresh search context; run by parallel workers.
+    A fresh transposition table per move keeps results independent of scheduling.
+    """
+    ctx = SearchContext(grid, TranspositionTable(PARALLEL_TT_MB), evaluator(grid), heuristics, rules)
+    return alphabeta(grid, x, y, depth - 1, alpha, beta, False, player, 3 - player, ctx)
+
+
+# Principal-variation moves remembered between turns
+PV_LENGTH = 8
+
+
+class Engine:
+    """
+    alpha_beta_plus as a game-long player that keeps its search state between turns.
+    Consecutive positions differ by two stones, so the transposition table,
+    the killer and history tables and the expected line (principal variation)
+    of the last search are carried over: when the opponent plays the expected
+    reply, the next search starts from the line's continuation.
+    Options are those of get_move(); memory_limit is the transposition table
+    size in MB (changing it starts a new, empty table).
+    Call new_game() between games and, if convenient, opponent_moved() after
+    each opponent move (get_move() also spots the expected reply on the board).
+    """
+
+    def __init__(self, depth=4, time_limit=None, threats='vcf', heuristics=HEURISTICS, evaluator=None,
+                 workers=None, book=None, cache=None, rules=None, memory_limit=32, tt=None):
+        self.depth = depth
+        self.time_limit = time_limit
+        self.threats = threats
+        self.heuristics = heuristics
+        self.evaluator = evaluator
+        self.workers = workers
+        self.book = book
+        self.cache = cache
+        self.rules = get_rules(rules)
+        self._memory_limit = memory_limit
+        self.tt = tt  # made on first search unless given
+        self.killers = {}
+        self.history = {}
+        self.pv = []  # expected moves from the current position on, opponent's reply first
+
+    @property
+    def memory_limit(self):
+        return self._memory_limit
+
+    @memory_limit.setter
+    def memory_limit(self, memory_mb):
+        if memory_mb != self._memory_limit:
+            self._memory_limit = memory_mb
+            self.tt = None
+
+    def new_game(self):
+        """Forget everything learned in the previous game."""
+        if self.tt is not None:
+            self.tt.clear()
+        self.killers = {}
+        self.history = {}
+        self.pv = []
+
+    def opponent_moved(self, x, y):
+        """Follow the expected line if (x, y) was the predicted reply, else drop it."""
+        self.pv = self.pv[1:] if self.pv[:1] == [(x, y)] else []
+
+    def _cache_config(self):
+        """AnalysisCache config string: results are only shared between engines with equal settings."""
+        evaluator = self.evaluator if self.evaluator is not None else IncrementalEvaluator
+        return f"{evaluator.__module__}.{evaluator.__qualname__}:{','.join(sorted(self.heuristics))}"
+
+    def _follow_pv(self, board, player):
+        """The line's next move for player if the board still matches it, else None."""
+        if self.pv and board[self.pv[0][1]][self.pv[0][0]] == 3 - player:
+            self.pv = self.pv[1:]  # expected reply played without notification
+        if self.pv and board[self.pv[0][1]][self.pv[0][0]] == 0:
+            return self.pv[0]
+        self.pv = []
+        return None
+
+    def _remember(self, ctx, best_move, player):
+        """Keep the expected line after best_move and shift killers two plies up."""
+        pv = []
+        # replay the line with the search's own colours (alphabeta places root moves as `opponent`)
+        ctx.place(best_move[0], best_move[1], 3 - player)
+        mover = player
+        while len(pv) < PV_LENGTH:
+            entry = ctx.tt.probe(ctx.key ^ ctx.zobrist.side[player])
+            move = entry[3] if entry is not None else None
+            if move is None or ctx.grid[move[1]][move[0]] != 0:
+                break
+            pv.append(move)
+            ctx.place(move[0], move[1], mover)
+            if ctx.wins(move[0], move[1], mover):
+                break
+            mover = 3 - mover
+        ctx.unwind()
+        self.pv = pv
+        self.killers = {ply - 2: moves for ply, moves in self.killers.items() if ply >= 2}
+        for move in self.history:
+            self.history[move] //= 2  # older cutoffs count less
+
+    def get_move(self, board, player, listener=None, stats=None):
+        """
+        Best move for player; see the module-level get_move() for the options.
+        listener and stats apply to this call only.
+        """
+        started = time.perf_counter()
+        opponent = 3 - player
+        rules = self.rules
+        book, cache, threats = self.book, self.cache, self.threats
+        if rules.name != 'freestyle':
+            book = cache = threats = None
+        hint = self._follow_pv(board, player)
+        self.pv = []
+        if book is not None:
+            with phase(stats, 'book'):
+                move = book.get_move(board, player)
+            if move is not None:
+                return move
+        if cache is not None:
+            with phase(stats, 'cache'):
+                hit = cache.get(board, player, self.depth, self._cache_config())
+            if hit is not None:
+                return hit[0]
+        if threats is not None:
+            with phase(stats, 'threats'):
+                line = find_vct(board, player) if threats == 'vct' else find_vcf(board, player)
+            if line:
+                return line[0]
+        with phase(stats, 'setup'):
+            if self.tt is None:
+                self.tt = TranspositionTable(self._memory_limit)
+            self.tt.new_search()
+            evaluator = self.evaluator if self.evaluator is not None else IncrementalEvaluator
+            ctx = SearchContext(board, self.tt, evaluator(board), self.heuristics, rules)
+            if ctx.killers is not None:
+                ctx.killers = self.killers
+            if ctx.history is not None:
+                ctx.history = self.history
+            ctx.listener = listener
+            ctx.stats = stats
+            candidates = ctx.legal(get_strategic_candidates(board, player, opponent, 12, ctx.runs, ctx.frontier),
+                                   player)
+            order_first(candidates, hint)
+        
+        if not candidates:
+            # Board is full
+            empties = ctx.legal([(x, y) for y in range(len(board)) for x in range(len(board)) if board[y][x] == 0],
+                                player)
+            return random.choice(empties) if empties else None
+        move = forced_move(ctx, candidates, player)
+        if move is not None:
+            return move
+        
+        depth = self.depth
+        if self.time_limit is None:
+            with phase(stats, 'search'):
+                if self.workers is not None and self.workers > 1:
+                    options = {'evaluator': evaluator, 'heuristics': self.heuristics, 'rules': rules.name}
+                    best_move, best_score, _ = parallel_search_root(__name__, board, candidates, depth, player,
+                                                                    self.workers, options)
+                    if cache is not None:
+                        cache.put(board, player, depth, best_score, best_move, self._cache_config())
+                    return best_move  # pool searches leave nothing to remember here
+                best_move, best_score, _ = search_root(ctx, candidates, depth, player, opponent)
+            if cache is not None:
+                cache.put(board, player, depth, best_score, best_move, self._cache_config())
+            self._remember(ctx, best_move, player)
+            return best_move
+        
+        # Iterative deepening: each iteration searches the previous best moves first
+        # (root order by score, inner nodes via the transposition table's best moves)
+        ctx.deadline = started + self.time_limit
+        best_move = candidates[0]
+        best_score = None
+        completed = 0
+        for d in range(1, depth + 1):
+            window = None
+            if 'aspiration' in ctx.heuristics and best_score is not None:
+                window = (best_score - ASPIRATION_WINDOW, best_score + ASPIRATION_WINDOW)
+            try:
+                with phase(stats, f'depth {d}'):
+                    move, score, scores = search_root(ctx, candidates, d, player, opponent, window)
+                    if window is not None and not window[0] < score < window[1]:
+                        move, score, scores = search_root(ctx, candidates, d, player, opponent)
+            except SearchTimeout:
+                ctx.unwind()
+                break
+            best_move, best_score = move, score
+            completed = d
+            if abs(best_score) >= WIN_SCORE:
+                break  # forced win or loss found; deeper search cannot change it
+            candidates.sort(key=lambda move: scores.get(move, float('-inf')), reverse=True)
+        
+        if cache is not None and completed:
+            cache.put(board, player, completed, best_score, best_move, self._cache_config())
+        self._remember(ctx, best_move, player)
+        return best_move
+
+
+def get_move(board, player, depth=4, tt=None, evaluator=None, time_limit=None, threats='vcf',
+             heuristics=HEURISTICS, workers=None, listener=None, stats=None, book=None,
+             cache=None, rules=None):
+    """
+    Find the best move for player using improved alpha-beta pruning.
+    Uses stronger heuristics and deeper search.
+    tt: TranspositionTable to reuse across calls; a fresh one is made if omitted.
+    evaluator: evaluator class built from board, e.g. patterns.PatternEvaluator;
+        defaults to IncrementalEvaluator.
+    time_limit: seconds; if given, deepen iteratively from depth 1 up to `depth`
+        and return the best move of the deepest iteration finished in time.
+    threats: 'vcf', 'vct' or None; threat-space pre-pass that plays a forced win
+        (see players.threat) before any alpha-beta search.
+    heuristics: subset of search.HEURISTICS ('killers', 'history', 'pvs',
+        'aspiration'); pass () to compare against plain alpha-beta.
+    workers: if > 1, fixed-depth searches score root moves on a shared process
+        pool (see players.parallel); ignored with time_limit.
+    listener: progress callback called with the SearchContext every few nodes.
+    stats: players.stats.SearchStats to fill in (node counts, cutoffs, TT hit
+        rate, phase times); with workers > 1 only the root phases are timed.
+    book: players.book.OpeningBook; a book move is played without searching.
+    cache: players.analysis_cache.AnalysisCache; a stored result at least
+        `depth` deep is played without searching, and new results are stored.
+    rules: rule set (name or core.rule.Rules) deciding wins and forbidden moves.
+        The book, the cache and the threat pre-pass assume freestyle and are
+        skipped under other rules.
+    Returns (x, y) tuple or None if board is full.
+    """
+    engine = Engine(depth, time_limit, threats, heuristics, evaluator, workers, book, cache, rules, tt=tt)
+    return engine.get_move(board, player, listener, stats)
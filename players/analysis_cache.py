@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import time
+
+from .book import canonical, from_canonical, to_canonical
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'analysis_cache.sqlite3')
+
+# Writes between checks of the entry count against max_entries
+EVICT_INTERVAL = 256
+# Table layout version (PRAGMA user_version); older tables are dropped, not migrated
+SCHEMA_VERSION = 1
+
+
+def _signed(key):
+    """64-bit Zobrist key as a signed integer (SQLite INTEGER range)."""
+    return key - (1 << 64) if key >= 1 << 63 else key
+
+
+class AnalysisCache:
+    """
+    Persistent cache of finished searches: position -> (depth, score, best move).
+    Positions are keyed like the opening book (smallest Zobrist key over the 8
+    symmetries, with the side to move), so symmetric positions share an entry,
+    together with the board size and a `config` string naming the search
+    settings (evaluator, heuristics) that produced the result.
+    The store is an SQLite file in WAL mode, which lets several processes read
+    and write it at once; each process opens its own connection lazily. Hits
+    refresh an entry's last-used time and, once the table holds more than
+    max_entries rows, the least recently used ones are evicted.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=200000):
+        self.path = path
+        self.max_entries = max_entries
+        self.writes = 0
+        self._conn = None
+        self._pid = None
+
+    def _db(self):
+        # connections must not cross fork(); reopen in a new process
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            if conn.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+                conn.execute('DROP TABLE IF EXISTS analysis')
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            conn.execute('CREATE TABLE IF NOT EXISTS analysis ('
+                         'key INTEGER, size INTEGER, config TEXT, depth INTEGER, score REAL, '
+                         'move INTEGER, used REAL, PRIMARY KEY (key, size, config))')
+            conn.execute('CREATE INDEX IF NOT EXISTS analysis_used ON analysis (used)')
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def __len__(self):
+        return self._db().execute('SELECT COUNT(*) FROM analysis').fetchone()[0]
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, grid, player, depth=0, config=''):
+        """(move, score, depth) stored for player to move, searched at least `depth` deep, or None."""
+        size = len(grid)
+        key, symmetry = canonical(grid, player)
+        key = _signed(key)
+        db = self._db()
+        row = db.execute('SELECT depth, score, move FROM analysis WHERE key = ? AND size = ? AND config = ?',
+                         (key, size, config)).fetchone()
+        if row is None or row[0] < depth:
+            return None
+        move = from_canonical(row[2], symmetry, size)
+        if grid[move[1]][move[0]] != 0:
+            return None
+        db.execute('UPDATE analysis SET used = ? WHERE key = ? AND size = ? AND config = ?',
+                   (time.time(), key, size, config))
+        return move, row[1], row[0]
+
+    def put(self, grid, player, depth, score, move, config=''):
+        """Record a search result; an existing deeper result is kept."""
+        size = len(grid)
+        key, symmetry = canonical(grid, player)
+        db = self._db()
+        db.execute('INSERT INTO analysis (key, size, config, depth, score, move, used) '
+                   'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                   'ON CONFLICT (key, size, config) DO UPDATE SET depth = excluded.depth, '
+                   'score = excluded.score, move = excluded.move, used = excluded.used '
+                   'WHERE excluded.depth >= analysis.depth',
+                   (_signed(key), size, config, depth, float(score), to_canonical(move, symmetry, size),
+                    time.time()))
+        self.writes += 1
+        if self.writes % EVICT_INTERVAL == 0:
+            self.evict()
+
+    def evict(self):
+        """Drop least recently used entries beyond max_entries."""
+        db = self._db()
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            db.execute('DELETE FROM analysis WHERE rowid IN '
+                       '(SELECT rowid FROM analysis ORDER BY used LIMIT ?)', (excess,))
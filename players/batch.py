@@ -0,0 +1,119 @@
+import numpy as np
+
+from .alpha_beta_plus import OPPONENT_WEIGHT, line_score
+from .patterns import OPPONENT_WEIGHT as PATTERN_OPPONENT_WEIGHT, SCORE_TABLES, WALL, WINDOW, line_indexes
+
+DIRECTIONS = [(1, 0), (0, 1), (1, 1), (1, -1)]
+
+# alpha_beta.evaluate: score per stone and direction, indexed by min(run length, 5)
+ALPHA_BETA_OWN = np.array([0, 10, 100, 1000, 15000, 100000], dtype=np.int64)
+ALPHA_BETA_OPP = np.array([0, 10, 150, 1500, 25000, 150000], dtype=np.int64)
+
+# alpha_beta_plus.line_score indexed by [min(run length, 5), open neighbours]
+ALPHA_BETA_PLUS_SCORES = np.array([[line_score(total, ends) for ends in range(3)] for total in range(6)],
+                                  dtype=np.int64)
+
+
+def _shift(mask, dx, dy, k):
+    """mask[n, y + k*dy, x + k*dx] at [n, y, x], False off the board."""
+    size = mask.shape[1]
+    out = np.zeros_like(mask)
+    sx, sy = k * dx, k * dy
+    if abs(sx) >= size or abs(sy) >= size:
+        return out
+    ys = slice(max(0, -sy), size - max(0, sy))
+    xs = slice(max(0, -sx), size - max(0, sx))
+    ys_src = slice(max(0, sy), size - max(0, -sy))
+    xs_src = slice(max(0, sx), size - max(0, -sx))
+    out[:, ys, xs] = mask[:, ys_src, xs_src]
+    return out
+
+
+def _run_lengths(mask, dx, dy):
+    """Length of the run along (dx, dy) through each cell of mask (0 where mask is False)."""
+    size = mask.shape[1]
+    total = mask.astype(np.int64)
+    for sign in (1, -1):
+        alive = mask.copy()
+        for k in range(1, size):
+            alive &= _shift(mask, sign * dx, sign * dy, k)
+            if not alive.any():
+                break
+            total += alive
+    return total
+
+
+def as_boards(boards):
+    """N x size x size int array from an array or a list of grids."""
+    boards = np.asarray(boards, dtype=np.int64)
+    if boards.ndim == 2:
+        boards = boards[np.newaxis]
+    return boards
+
+
+def alpha_beta_scores(boards, player, opponent):
+    """alpha_beta.evaluate for every board of an N x size x size stack."""
+    boards = as_boards(boards)
+    scores = np.zeros(boards.shape[0], dtype=np.int64)
+    for colour, table, sign in ((player, ALPHA_BETA_OWN, 1), (opponent, ALPHA_BETA_OPP, -1)):
+        mask = boards == colour
+        for dx, dy in DIRECTIONS:
+            runs = np.minimum(_run_lengths(mask, dx, dy), 5)
+            scores += sign * np.where(mask, table[runs], 0).sum(axis=(1, 2))
+    return scores
+
+
+def alpha_beta_plus_scores(boards, player, opponent):
+    """alpha_beta_plus.evaluate for every board of an N x size x size stack."""
+    boards = as_boards(boards)
+    empty = boards == 0
+    totals = {}
+    for colour in (player, opponent):
+        mask = boards == colour
+        total = np.zeros(boards.shape[0], dtype=np.int64)
+        for dx, dy in DIRECTIONS:
+            runs = np.minimum(_run_lengths(mask, dx, dy), 5)
+            # open ends are the empty cells right next to the stone itself
+            ends = _shift(empty, dx, dy, 1).astype(np.int64) + _shift(empty, -dx, -dy, 1)
+            total += np.where(mask, ALPHA_BETA_PLUS_SCORES[runs, ends], 0).sum(axis=(1, 2))
+        totals[colour] = total
+    return totals[player] - totals[opponent] * OPPONENT_WEIGHT
+
+
+def pattern_scores(boards, player, opponent):
+    """patterns.evaluate for every board of an N x size x size stack."""
+    boards = as_boards(boards)
+    n, size = boards.shape[0], boards.shape[1]
+    flat = np.concatenate([boards.reshape(n, size * size), np.full((n, 1), WALL, dtype=np.int64)], axis=1)
+    lines = flat[:, line_indexes(size)]
+    span = lines.shape[2] - WINDOW + 1
+    codes = np.zeros((n, lines.shape[1], span), dtype=np.int64)
+    for k in range(WINDOW):
+        codes = codes * 4 + lines[:, :, k:k + span]
+    own = SCORE_TABLES[player][codes].sum(axis=(1, 2))
+    opp = SCORE_TABLES[opponent][codes].sum(axis=(1, 2))
+    return own - opp * PATTERN_OPPONENT_WEIGHT
+
+
+EVALUATORS = {
+    'alpha_beta': alpha_beta_scores,
+    'alpha_beta_plus': alpha_beta_plus_scores,
+    'patterns': pattern_scores,
+}
+
+
+def evaluate_batch(boards, player, opponent, evaluator='alpha_beta_plus'):
+    """
+    Score N boards at once (an N x size x size array or a list of grids).
+    Returns a length-N NumPy array equal, board by board, to the scalar
+    evaluate() named by `evaluator` ('alpha_beta', 'alpha_beta_plus' or 'patterns').
+    """
+    return EVALUATORS[evaluator](boards, player, opponent)
+
+
+def evaluate_moves(grid, moves, player, opponent, evaluator='alpha_beta_plus'):
+    """Scores of grid after each of player's moves, one batched call for all of them."""
+    boards = np.repeat(as_boards(grid), len(moves), axis=0)
+    for i, (x, y) in enumerate(moves):
+        boards[i, y, x] = player
+    return evaluate_batch(boards, player, opponent, evaluator)
@@ -0,0 +1,158 @@
+import mmap
+import os
+import struct
+
+from core.zobrist import zobrist_for
+
+# File layout: header, then `count` fixed-size entries sorted by key.
+MAGIC = b'GMKBOOK1'
+HEADER = struct.Struct('<8sII')     # magic, board size, entry count
+ENTRY = struct.Struct('<QHxxi')     # canonical key, canonical move index, score
+_KEY = struct.Struct('<Q')
+
+DEFAULT_BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'opening_book.bin')
+
+
+def symmetries(size):
+    """The 8 board symmetries as functions (x, y) -> (x, y)."""
+    m = size - 1
+    return [
+        lambda x, y: (x, y),
+        lambda x, y: (m - x, y),
+        lambda x, y: (x, m - y),
+        lambda x, y: (m - x, m - y),
+        lambda x, y: (y, x),
+        lambda x, y: (m - y, x),
+        lambda x, y: (y, m - x),
+        lambda x, y: (m - y, m - x),
+    ]
+
+
+# INVERSE[s]: the symmetry that undoes symmetry s
+INVERSE = [0, 1, 2, 3, 4, 6, 5, 7]
+
+
+def canonical(grid, player):
+    """(key, symmetry) of the position with `player` to move.
+
+    The key is the smallest Zobrist key over the 8 symmetric images of the
+    board, so all of them share one book entry; symmetry is the index (into
+    symmetries()) of the image that produced it.
+    """
+    size = len(grid)
+    zobrist = zobrist_for(size)
+    stones = [(x, y, v) for y, row in enumerate(grid) for x, v in enumerate(row) if v != 0]
+    best = None
+    for s, transform in enumerate(symmetries(size)):
+        key = zobrist.side[player]
+        for x, y, v in stones:
+            tx, ty = transform(x, y)
+            key ^= zobrist.keys[v][ty * size + tx]
+        if best is None or key < best[0]:
+            best = (key, s)
+    return best
+
+
+def to_canonical(move, symmetry, size):
+    """Flat index of move on the canonical image (symmetry from canonical())."""
+    x, y = symmetries(size)[symmetry](*move)
+    return y * size + x
+
+
+def from_canonical(index, symmetry, size):
+    """Map a canonical move index back onto the board the key was computed from."""
+    return symmetries(size)[INVERSE[symmetry]](index % size, index // size)
+
+
+def write_book(path, entries, size=15):
+    """Write {canonical key: (canonical move index, score)} as a sorted book file.
+
+    The file is written next to `path` and renamed into place, so readers
+    never see a partial book.
+    """
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, size, len(entries)))
+        for key in sorted(entries):
+            index, score = entries[key]
+            f.write(ENTRY.pack(key, index, int(score)))
+    os.replace(tmp, path)
+
+
+class OpeningBook:
+    """
+    Read-only opening book backed by a memory-mapped file.
+    Nothing is parsed at load time: lookups canonicalise the position and
+    binary-search the sorted entries in place, so opening a book costs the
+    same whatever its size.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            self.data.close()
+            raise ValueError(f"{path}: not an opening book")
+        magic, self.size, self.count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or len(self.data) != HEADER.size + self.count * ENTRY.size:
+            self.data.close()
+            raise ValueError(f"{path}: not an opening book")
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def find(self, key):
+        """(canonical move index, score) stored for key, or None."""
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k = _KEY.unpack_from(self.data, HEADER.size + mid * ENTRY.size)[0]
+            if k < key:
+                lo = mid + 1
+            elif k > key:
+                hi = mid
+            else:
+                _, index, score = ENTRY.unpack_from(self.data, HEADER.size + mid * ENTRY.size)
+                return index, score
+        return None
+
+    def probe(self, grid, player):
+        """((x, y), score) for player to move in grid, or None if out of book."""
+        if len(grid) != self.size:
+            return None
+        key, symmetry = canonical(grid, player)
+        entry = self.find(key)
+        if entry is None:
+            return None
+        move = from_canonical(entry[0], symmetry, self.size)
+        if grid[move[1]][move[0]] != 0:
+            return None
+        return move, entry[1]
+
+    def get_move(self, grid, player):
+        """Book move (x, y) for player, or None."""
+        hit = self.probe(grid, player)
+        return hit[0] if hit else None
+
+
+_default_book = []
+
+
+def default_book():
+    """The book at DEFAULT_BOOK_PATH (opened once per process), or None if absent."""
+    if not _default_book:
+        try:
+            _default_book.append(OpeningBook(DEFAULT_BOOK_PATH))
+        except (OSError, ValueError):
+            _default_book.append(None)
+    return _default_book[0]
@@ -0,0 +1,105 @@
+from core.board import stones
+
+_neighbour_tables = {}
+
+
+def neighbour_table(size, radius):
+    """table[i] -> [(j, weight)] for cells j within `radius` (Chebyshev) of flat index i.
+
+    Closer cells weigh more: weight = radius + 1 - distance.
+    """
+    table = _neighbour_tables.get((size, radius))
+    if table is not None:
+        return table
+    table = []
+    for y in range(size):
+        for x in range(size):
+            cells = []
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    nx, ny = x + dx, y + dy
+                    if (dx or dy) and 0 <= nx < size and 0 <= ny < size:
+                        cells.append((ny * size + nx, radius + 1 - max(abs(dx), abs(dy))))
+            table.append(cells)
+    _neighbour_tables[(size, radius)] = table
+    return table
+
+
+class CandidateFrontier:
+    """
+    Incrementally maintained set of empty cells near existing stones.
+    Every cell keeps a reference count (weighted by distance) of the stones
+    within `radius`; place/remove only touch the (2*radius+1)^2 neighbourhood,
+    so move generation never rescans the board. candidates() returns cells in
+    a deterministic priority order: heaviest weight first, then row-major.
+    """
+
+    def __init__(self, size=15, radius=2):
+        self.size = size
+        self.radius = radius
+        self._neighbours = neighbour_table(size, radius)
+        self.reset()
+
+    def reset(self):
+        n = self.size * self.size
+        self.weight = [0] * n
+        self.occupied = bytearray(n)
+        self.stones = 0
+        self.cells = set()
+
+    @classmethod
+    def from_grid(cls, grid, radius=2):
+        frontier = cls(len(grid), radius)
+        for x, y, _ in stones(grid):
+            frontier.place(x, y)
+        return frontier
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, move):
+        x, y = move
+        return y * self.size + x in self.cells
+
+    def place(self, x, y):
+        i = y * self.size + x
+        self.occupied[i] = 1
+        self.stones += 1
+        self.cells.discard(i)
+        weight = self.weight
+        for j, w in self._neighbours[i]:
+            weight[j] += w
+            if not self.occupied[j]:
+                self.cells.add(j)
+
+    def remove(self, x, y):
+        i = y * self.size + x
+        self.occupied[i] = 0
+        self.stones -= 1
+        weight = self.weight
+        for j, w in self._neighbours[i]:
+            weight[j] -= w
+            if weight[j] == 0:
+                self.cells.discard(j)
+        if weight[i] > 0:
+            self.cells.add(i)
+
+    def cells_in_order(self):
+        """Frontier cells as (x, y) in row-major order."""
+        size = self.size
+        return [(i % size, i // size) for i in sorted(self.cells)]
+
+    def candidates(self, limit=None):
+        """Frontier cells by priority; the centre area when the board is empty."""
+        size = self.size
+        if self.stones == 0:
+            center = size // 2
+            cells = [(center + dx, center + dy) for dy in range(-1, 2) for dx in range(-1, 2)
+                     if 0 <= center + dx < size and 0 <= center + dy < size]
+            cells.sort(key=lambda c: (abs(c[0] - center) + abs(c[1] - center), c[1], c[0]))
+            return cells[:limit]
+        weight = self.weight
+        order = sorted(self.cells, key=lambda i: (-weight[i], i))
+        if limit is not None:
+            order = order[:limit]
+        return [(i % size, i // size) for i in order]
@@ -0,0 +1,263 @@
+import math
+import random
+import time
+
+from core.board import stones
+from core.rule import get_rules
+
+# Cell values of ArrayBoard; WALL fills the border so scans need no bounds checks
+EMPTY, WALL = 0, 3
+PAD = 2
+
+# Default budget when neither iterations nor time_limit is given (seconds)
+DEFAULT_TIME_LIMIT = 1.0
+# Playouts run from every new leaf; their results are backed up together
+PLAYOUTS_PER_VISIT = 4
+EXPLORATION = 1.4
+# Progressive widening: a node may have WIDENING_BASE + visits ** WIDENING_EXPONENT children
+WIDENING_BASE = 3
+WIDENING_EXPONENT = 0.5
+
+
+class ArrayBoard:
+    """
+    Flat board for playouts: cells in one list with a WALL border two cells
+    wide, so every neighbour lookup is an index offset. place() reports a
+    five at once and records, per player, the empty cells that would
+    complete a five (`threats`), which the playout policy plays or blocks.
+    `near` collects empty cells next to stones (may hold duplicates and
+    filled cells; users skip those). Fives are freestyle (five or more).
+    """
+
+    __slots__ = ('size', 'width', 'cells', 'stones', 'near', 'threats', 'empty', 'lines', 'ring1', 'ring2')
+
+    def __init__(self, size=15):
+        self.size = size
+        self.width = width = size + PAD
+        self.cells = [WALL] * ((size + 2 * PAD + 1) * width)
+        for y in range(size):
+            for x in range(size):
+                self.cells[self.index(x, y)] = EMPTY
+        self.stones = []
+        self.near = []
+        self.threats = [None, [], []]
+        self.empty = size * size
+        self.lines = (1, width, width + 1, width - 1)
+        self.ring1 = [dy * width + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+        self.ring2 = [dy * width + dx for dy in range(-2, 3) for dx in range(-2, 3) if dx or dy]
+
+    @classmethod
+    def from_grid(cls, grid):
+        board = cls(len(grid))
+        for x, y, v in stones(grid):
+            board.place(board.index(x, y), v)
+        return board
+
+    def copy(self):
+        board = ArrayBoard.__new__(ArrayBoard)
+        board.size = self.size
+        board.width = self.width
+        board.cells = self.cells[:]
+        board.stones = self.stones[:]
+        board.near = self.near[:]
+        board.threats = [None, self.threats[1][:], self.threats[2][:]]
+        board.empty = self.empty
+        board.lines = self.lines
+        board.ring1 = self.ring1
+        board.ring2 = self.ring2
+        return board
+
+    def index(self, x, y):
+        return (y + PAD) * self.width + x + PAD
+
+    def coords(self, i):
+        y, x = divmod(i, self.width)
+        return x - PAD, y - PAD
+
+    def place(self, i, player):
+        """Put player's stone on empty cell i; True if it makes five."""
+        cells = self.cells
+        cells[i] = player
+        self.stones.append(i)
+        self.empty -= 1
+        threats = self.threats[player]
+        for step in self.lines:
+            a = i - step
+            while cells[a] == player:
+                a -= step
+            b = i + step
+            while cells[b] == player:
+                b += step
+            run = (b - a) // step - 1
+            if run >= 5:
+                return True
+            # an empty cell at either end of the run completes five with the stones beyond it
+            for end, step_out in ((a, -step), (b, step)):
+                if cells[end] == EMPTY:
+                    c = end + step_out
+                    total = run + 1
+                    while cells[c] == player:
+                        total += 1
+                        c += step_out
+                    if total >= 5:
+                        threats.append(end)
+        near = self.near
+        for offset in self.ring1:
+            if cells[i + offset] == EMPTY:
+                near.append(i + offset)
+        return False
+
+    def threat(self, player):
+        """An empty cell where player completes five, or None."""
+        cells = self.cells
+        threats = self.threats[player]
+        while threats:
+            if cells[threats[-1]] == EMPTY:
+                return threats[-1]
+            threats.pop()
+        return None
+
+    def tree_moves(self, player):
+        """
+        Moves considered in the tree for player, best first: a winning cell
+        alone, else the cells blocking the opponent's five, else empty cells
+        within two of a stone ordered by how many stones are near.
+        """
+        win = self.threat(player)
+        if win is not None:
+            return [win]
+        cells = self.cells
+        blocks = sorted({i for i in self.threats[3 - player] if cells[i] == EMPTY})
+        if blocks:
+            return blocks
+        if not self.stones:
+            return [self.index(self.size // 2, self.size // 2)]
+        weight = {}
+        for s in self.stones:
+            for offset in self.ring2:
+                j = s + offset
+                if cells[j] == EMPTY:
+                    weight[j] = weight.get(j, 0) + 1
+        return sorted(weight, key=lambda j: (-weight[j], j))
+
+
+def playout(board, mover, rng):
+    """Play board out from `mover` to move; returns the winner, or 0 for a draw."""
+    cells = board.cells
+    near = board.near
+    while True:
+        move = board.threat(mover)
+        if move is None:
+            move = board.threat(3 - mover)
+        if move is None:
+            while near:
+                k = rng.randrange(len(near))
+                j = near[k]
+                near[k] = near[-1]
+                near.pop()
+                if cells[j] == EMPTY:
+                    move = j
+                    break
+            else:
+                return 0  # no empty cell next to a stone left
+        if board.place(move, mover):
+            return mover
+        mover = 3 - mover
+
+
+class Node:
+    """Tree node for the position after `mover` played `move`; wins count from mover's side."""
+
+    __slots__ = ('move', 'parent', 'mover', 'children', 'untried', 'visits', 'wins', 'terminal')
+
+    def __init__(self, move, parent, mover):
+        self.move = move
+        self.parent = parent
+        self.mover = mover
+        self.children = []
+        self.untried = []  # tree_moves() order, reversed so pop() takes the best
+        self.visits = 0
+        self.wins = 0.0
+        self.terminal = None  # winner (or 0 for a draw) once the game is over here
+
+    def expandable(self, widening):
+        if not self.untried:
+            return False
+        if not widening:
+            return True
+        return len(self.children) < WIDENING_BASE + self.visits ** WIDENING_EXPONENT
+
+    def select(self, exploration):
+        log_n = math.log(self.visits)
+        return max(self.children, key=lambda c: c.wins / c.visits + exploration * math.sqrt(log_n / c.visits))
+
+
+def _expand(node, board):
+    move = node.untried.pop()
+    mover = 3 - node.mover
+    child = Node(move, node, mover)
+    if board.place(move, mover):
+        child.terminal = mover
+    else:
+        child.untried = board.tree_moves(3 - mover)[::-1]
+        if not child.untried or board.empty == 0:
+            child.terminal = 0
+    node.children.append(child)
+    return child
+
+
+def get_move(board, player, iterations=None, time_limit=None, playouts=PLAYOUTS_PER_VISIT,
+             exploration=EXPLORATION, widening=True, seed=None, rules=None):
+    """
+    Monte Carlo tree search (UCT) move for player.
+    iterations: tree visits to run; time_limit: seconds. With neither,
+        DEFAULT_TIME_LIMIT seconds are used; with both, whichever ends first.
+    playouts: random playouts run from each new leaf (batched into one backup).
+    widening: progressive widening; a node's children are added best first
+        (see ArrayBoard.tree_moves) as its visit count grows.
+    seed: for the playout random generator; by default it is drawn from the
+        `random` module, so random.seed() makes games reproducible.
+    rules: only freestyle is supported (fives of any length win).
+    Returns (x, y) tuple or None if board is full.
+    """
+    if get_rules(rules).name != 'freestyle':
+        raise ValueError('mcts only plays freestyle rules')
+    if iterations is None and time_limit is None:
+        time_limit = DEFAULT_TIME_LIMIT
+    rng = random.Random(seed if seed is not None else random.getrandbits(64))
+    root_board = ArrayBoard.from_grid(board)
+    root = Node(None, None, 3 - player)
+    root.untried = root_board.tree_moves(player)[::-1]
+    if not root.untried:
+        return None
+    if len(root.untried) == 1:
+        return root_board.coords(root.untried[0])
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    done = 0
+    while (iterations is None or done < iterations) and (deadline is None or time.perf_counter() < deadline):
+        done += 1
+        node = root
+        state = root_board.copy()
+        # selection
+        while node.terminal is None and not node.expandable(widening) and node.children:
+            node = node.select(exploration)
+            state.place(node.move, node.mover)
+        # expansion
+        if node.terminal is None and node.expandable(widening):
+            node = _expand(node, state)
+        # simulation: a batch of playouts from the new leaf
+        if node.terminal is not None:
+            results = [node.terminal] * playouts
+        else:
+            results = [playout(state.copy(), 3 - node.mover, rng) for _ in range(playouts)]
+        wins = {1: results.count(1), 2: results.count(2)}
+        draws = playouts - wins[1] - wins[2]
+        # backpropagation
+        while node is not None:
+            node.visits += playouts
+            node.wins += wins[node.mover] + 0.5 * draws
+            node = node.parent
+    if not root.children:
+        return root_board.coords(root.untried[-1])  # no iteration ran; best-ordered move
+    best = max(root.children, key=lambda c: c.visits)
+    return root_board.coords(best.move)
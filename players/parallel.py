@@ -0,0 +1,66 @@
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Transposition table size for each root move searched by a worker
+PARALLEL_TT_MB = 8
+
+_pool = None
+_pool_workers = 0
+
+
+def get_pool(workers):
+    """Process pool shared by every parallel search; created once and reused across moves."""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != workers:
+        if _pool is not None:
+            _pool.shutdown()
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_workers = workers
+    return _pool
+
+
+def shutdown_pool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = None
+    _pool_workers = 0
+
+
+def _search_candidate(module_name, grid, x, y, depth, player, alpha, beta, options):
+    # runs in a worker process; the module is imported there by name
+    module = importlib.import_module(module_name)
+    return module.search_candidate(grid, x, y, depth, player, alpha, beta, **options)
+
+
+def parallel_search_root(module_name, board, candidates, depth, player, workers, options=None):
+    """
+    Root-parallel search: score root candidates on the shared process pool.
+
+    Candidates are dispatched in fixed batches of `workers` moves. Each batch is
+    searched with alpha set to the best score of the batches before it, so
+    later batches prune against the bound found so far, yet the scores (and
+    the chosen move, ties going to the earlier candidate) do not depend on
+    worker scheduling. `module_name` must provide
+    search_candidate(grid, x, y, depth, player, alpha, beta, **options).
+    Returns (best_move, best_score, scores) like alpha_beta_plus.search_root.
+    """
+    pool = get_pool(workers)
+    grid = [list(row) for row in board]  # plain lists pickle for any board backend
+    options = options or {}
+    moves = [(x, y) for x, y in candidates if grid[y][x] == 0]
+    best_move = candidates[0]
+    best_score = float('-inf')
+    scores = {}
+    for start in range(0, len(moves), workers):
+        batch = moves[start:start + workers]
+        alpha = best_score
+        futures = [pool.submit(_search_candidate, module_name, grid, x, y, depth, player,
+                               alpha, float('inf'), options) for x, y in batch]
+        for move, future in zip(batch, futures):
+            score = future.result()
+            scores[move] = score
+            if score > best_score:
+                best_score = score
+                best_move = move
+    return best_move, best_score, scores
@@ -0,0 +1,135 @@
+import numpy as np
+
+# Window length used for pattern lookup; 6 cells see both ends of a live four
+WINDOW = 6
+WALL = 3  # cell code for off-board padding
+
+# Shape scores per window. Overlapping windows each score the shape they see,
+# so longer live shapes are naturally counted several times.
+FIVE = 100000
+LIVE_FOUR = 10000
+DEAD_FOUR = 1000
+LIVE_THREE = 1000
+DEAD_THREE = 100
+LIVE_TWO = 100
+DEAD_TWO = 10
+ONE = 1
+
+# Weight applied to the opponent's shapes so defence is preferred
+OPPONENT_WEIGHT = 1.5
+
+
+def classify(window, player):
+    """Score a WINDOW-tuple of cell codes from player's point of view.
+
+    Recognises split shapes (e.g. X_XX) as well as contiguous runs: a shape is
+    any 5 cells free of opponent stones and walls, scored by how many of
+    player's stones it holds; live shapes additionally need both ends open.
+    """
+    own = [v == player for v in window]
+    free = [v == player or v == 0 for v in window]
+    for start in range(WINDOW - 4):
+        if all(own[start:start + 5]):
+            return FIVE
+    # live shapes: empty at both ends, no blockers in between
+    if window[0] == 0 and window[-1] == 0 and all(free[1:-1]):
+        count = sum(own[1:-1])
+        if count == 4:
+            return LIVE_FOUR
+        if count == 3:
+            return LIVE_THREE
+        if count == 2:
+            return LIVE_TWO
+    best = 0
+    for start in range(WINDOW - 4):
+        if all(free[start:start + 5]):
+            count = sum(own[start:start + 5])
+            best = max(best, (0, ONE, DEAD_TWO, DEAD_THREE, DEAD_FOUR, FIVE)[count])
+    return best
+
+
+def _build_tables():
+    codes = np.arange(4 ** WINDOW)
+    digits = [(codes // 4 ** (WINDOW - 1 - k)) % 4 for k in range(WINDOW)]
+    windows = list(zip(*[d.tolist() for d in digits]))
+    tables = np.zeros((3, 4 ** WINDOW), dtype=np.int64)
+    for player in (1, 2):
+        tables[player] = [classify(w, player) for w in windows]
+    return tables
+
+
+# SCORE_TABLES[player][code]: score of the window whose base-4 digits are its cells
+SCORE_TABLES = _build_tables()
+
+_line_indexes = {}
+
+
+def line_indexes(size):
+    """Index array (lines x size+2) into a flat board with one extra WALL slot.
+
+    Every row, column, diagonal and anti-diagonal becomes one row of the array,
+    padded with the wall slot at both ends (and after short diagonals), so all
+    lines can be gathered from the board with a single fancy-indexing step.
+    """
+    idx = _line_indexes.get(size)
+    if idx is not None:
+        return idx
+    wall = size * size
+    lines = []
+    for y in range(size):
+        lines.append([y * size + x for x in range(size)])
+    for x in range(size):
+        lines.append([y * size + x for y in range(size)])
+    for k in range(-(size - 1), size):
+        diag = [y * size + y + k for y in range(size) if 0 <= y + k < size]
+        anti = [y * size + (size - 1 - y - k) for y in range(size) if 0 <= size - 1 - y - k < size]
+        for line in (diag, anti):
+            if len(line) >= 5:
+                lines.append(line)
+    idx = np.full((len(lines), size + 2), wall, dtype=np.intp)
+    for i, line in enumerate(lines):
+        idx[i, 1:len(line) + 1] = line
+    _line_indexes[size] = idx
+    return idx
+
+
+def window_codes(flat, size):
+    """Base-4 codes of every WINDOW-cell window on every line of a flat board."""
+    lines = np.append(flat, WALL)[line_indexes(size)]
+    span = lines.shape[1] - WINDOW + 1
+    codes = np.zeros((lines.shape[0], span), dtype=np.int64)
+    for k in range(WINDOW):
+        codes = codes * 4 + lines[:, k:k + span]
+    return codes
+
+
+def evaluate(grid, player, opponent):
+    """
+    Pattern-table evaluation.
+    Returns a score: positive favors player, negative favors opponent.
+    """
+    board = np.asarray(grid, dtype=np.int64)
+    codes = window_codes(board.ravel(), board.shape[0])
+    return int(SCORE_TABLES[player][codes].sum()) - int(SCORE_TABLES[opponent][codes].sum()) * OPPONENT_WEIGHT
+
+
+class PatternEvaluator:
+    """
+    Evaluator object for SearchContext backed by the pattern tables.
+    Keeps its own flat NumPy copy of the board; place/remove are O(1) and
+    score() extracts and scores every line at once.
+    """
+
+    def __init__(self, grid):
+        self.size = len(grid)
+        self.flat = np.asarray([list(row) for row in grid], dtype=np.int64).ravel()
+
+    def place(self, x, y, player):
+        self.flat[y * self.size + x] = player
+
+    def remove(self, x, y):
+        self.flat[y * self.size + x] = 0
+
+    def score(self, player, opponent):
+        codes = window_codes(self.flat, self.size)
+        return int(SCORE_TABLES[player][codes].sum()) - int(SCORE_TABLES[opponent][codes].sum()) * OPPONENT_WEIGHT
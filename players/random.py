@@ -1,8 +1,14 @@
 import random
 
-def get_move(board, player):
-    """Return a random empty (x, y) tuple from the board or None if full."""
-    empties = [(x, y) for y, row in enumerate(board) for x, v in enumerate(row) if v == 0]
+from core.rule import get_rules
+
+
+def get_move(board, player, rules=None):
+    """Return a random empty (x, y) tuple from the board or None if full.
+    rules: rule set (see core.rule); moves it forbids to player are never chosen."""
+    rules = get_rules(rules)
+    empties = [(x, y) for y, row in enumerate(board) for x, v in enumerate(row)
+               if v == 0 and not (rules.restricted and rules.forbidden(board, x, y, player))]
     if not empties:
         return None
     return random.choice(empties)
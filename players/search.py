@@ -0,0 +1,186 @@
+import time
+
+from core.rule import RunTable, get_rules
+from core.zobrist import zobrist_for
+from .frontier import CandidateFrontier
+from .transposition import EXACT, LOWER, UPPER
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when SearchContext.deadline has passed."""
+
+
+# Move-ordering and window heuristics a search may switch on
+HEURISTICS = frozenset({'killers', 'history', 'pvs', 'aspiration'})
+
+# Nodes between wall-clock checks (power of two minus one, used as a mask)
+TIME_CHECK_MASK = 15
+
+
+class SearchContext:
+    """Incremental state shared by every node of one alpha-beta search.
+
+    The search places and removes stones through place()/remove() so that the
+    grid, the RunTable used for win checks, the CandidateFrontier used for move
+    generation and the Zobrist key always describe the same position. An
+    optional TranspositionTable is consulted through tt_probe()/tt_store(),
+    and an optional incremental evaluator (an object with place/remove/score)
+    is kept in step with the board. When `deadline` (a time.perf_counter()
+    value) is set, tick() raises SearchTimeout once it passes; unwind() then
+    takes back every stone the aborted search placed.
+    `listener`, if set, is called with the context every few nodes (progress).
+    `stats`, if set, is a players.stats.SearchStats filled in by the search.
+    `heuristics` is a subset of HEURISTICS: killer moves and the history table
+    feed order_moves(); `pvs` and `aspiration` are read by the search itself.
+    `rules` (core.rule) decides wins() and which moves legal() lets through.
+    """
+
+    def __init__(self, grid, tt=None, evaluator=None, heuristics=(), rules=None):
+        self.grid = grid
+        self.rules = get_rules(rules)
+        self.runs = RunTable.from_grid(grid)
+        self.frontier = CandidateFrontier.from_grid(grid)
+        self.zobrist = zobrist_for(len(grid))
+        self.key = self.zobrist.hash_grid(grid)
+        self.tt = tt
+        self.evaluator = evaluator
+        self.deadline = None
+        self.listener = None
+        self.stats = None
+        self.nodes = 0
+        self.stack = []
+        self.heuristics = frozenset(heuristics)
+        self.pvs = 'pvs' in self.heuristics
+        # killers[ply] -> [move, move]; history[move] -> accumulated depth^2 of cutoffs
+        self.killers = {} if 'killers' in self.heuristics else None
+        self.history = {} if 'history' in self.heuristics else None
+
+    def tick(self):
+        """Count a node, report progress and enforce the deadline."""
+        self.nodes += 1
+        if self.nodes & TIME_CHECK_MASK == 0:
+            if self.listener is not None:
+                self.listener(self)
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout()
+
+    def place(self, x, y, player):
+        self.stack.append((x, y))
+        self.grid[y][x] = player
+        if self.evaluator is not None:
+            self.evaluator.place(x, y, player)
+        self.runs.place(x, y, player)
+        self.frontier.place(x, y)
+        self.key = self.zobrist.toggle(self.key, x, y, player)
+
+    def remove(self, x, y):
+        self.key = self.zobrist.toggle(self.key, x, y, self.grid[y][x])
+        self.runs.remove(x, y)
+        self.frontier.remove(x, y)
+        if self.evaluator is not None:
+            self.evaluator.remove(x, y)
+        self.grid[y][x] = 0
+        self.stack.pop()
+
+    def unwind(self):
+        """Remove every stone still placed by an aborted search."""
+        while self.stack:
+            x, y = self.stack[-1]
+            self.remove(x, y)
+
+    def wins(self, x, y, player):
+        """True if the stone just placed at (x,y) wins for player under the rules."""
+        return self.rules.wins(self.runs, x, y, player)
+
+    def legal(self, candidates, player):
+        """candidates without the moves the rules forbid to player."""
+        if not self.rules.restricted:
+            return candidates
+        forbidden = self.rules.forbidden
+        return [(x, y) for x, y in candidates if not forbidden(self.grid, x, y, player)]
+
+    def tt_probe(self, depth, alpha, beta, player):
+        """Look up the current position.
+
+        Returns (score, alpha, beta, move): score is not None when the stored
+        bound already decides this node; otherwise alpha/beta are tightened and
+        move is the stored best move (or None) to try first.
+        """
+        if self.tt is None:
+            return None, alpha, beta, None
+        entry = self.tt.probe(self.key ^ self.zobrist.side[player])
+        stats = self.stats
+        if entry is None:
+            if stats is not None:
+                stats.tt_probe(False)
+            return None, alpha, beta, None
+        e_depth, flag, score, move = entry
+        if e_depth >= depth:
+            if flag == LOWER:
+                alpha = max(alpha, score)
+            elif flag == UPPER:
+                beta = min(beta, score)
+            if flag == EXACT or alpha >= beta:
+                if stats is not None:
+                    stats.tt_probe(True, cutoff=True)
+                return score, alpha, beta, move
+        if stats is not None:
+            stats.tt_probe(True)
+        return None, alpha, beta, move
+
+    def tt_store(self, depth, value, alpha, beta, move, player):
+        """Store value searched with the original (alpha, beta) window."""
+        if self.tt is None:
+            return
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.tt.store(self.key ^ self.zobrist.side[player], depth, flag, value, move)
+
+    def order_moves(self, candidates, tt_move, mover):
+        """Order candidates for `mover` at the current ply.
+
+        Immediate wins and blocks come first, then the transposition-table move,
+        then killer moves, then the rest by history score (ties keep the
+        generator's order). Without killers/history this is order_first().
+        """
+        if self.killers is None and self.history is None:
+            return order_first(candidates, tt_move)
+        makes_five = self.runs.makes_five
+        killers = self.killers.get(len(self.stack), ()) if self.killers is not None else ()
+        history = self.history if self.history is not None else {}
+
+        def rank(move):
+            x, y = move
+            if makes_five(x, y, mover) or makes_five(x, y, 3 - mover):
+                tier = 0
+            elif move == tt_move:
+                tier = 1
+            elif move in killers:
+                tier = 2
+            else:
+                tier = 3
+            return tier, -history.get(move, 0)
+
+        return sorted(candidates, key=rank)
+
+    def record_cutoff(self, move, depth):
+        """Credit a move that caused a cutoff with `depth` plies left."""
+        if self.killers is not None:
+            slots = self.killers.setdefault(len(self.stack), [None, None])
+            if slots[0] != move:
+                slots[1] = slots[0]
+                slots[0] = move
+        if self.history is not None:
+            self.history[move] = self.history.get(move, 0) + depth * depth
+
+
+def order_first(candidates, move):
+    """Move `move` to the front of candidates if present."""
+    if move is not None and move in candidates:
+        candidates.remove(move)
+        candidates.insert(0, move)
+    return candidates
@@ -0,0 +1,84 @@
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class SearchStats:
+    """
+    Optional collector of search statistics, passed to get_move(stats=...).
+    The search only touches it through `if stats is not None` checks, so a
+    search without a collector pays nothing beyond those tests.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.nodes_by_ply = []      # nodes entered at each ply below the root
+        self.cutoffs = 0
+        self.cutoff_index = {}      # index of the move that caused a cutoff -> count
+        self.evaluations = 0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.tt_cutoffs = 0
+        self.phase_times = {}       # phase name -> seconds
+
+    def node(self, ply):
+        if ply >= len(self.nodes_by_ply):
+            self.nodes_by_ply.extend([0] * (ply + 1 - len(self.nodes_by_ply)))
+        self.nodes_by_ply[ply] += 1
+
+    def cutoff(self, index):
+        self.cutoffs += 1
+        self.cutoff_index[index] = self.cutoff_index.get(index, 0) + 1
+
+    def tt_probe(self, hit, cutoff=False):
+        self.tt_probes += 1
+        if hit:
+            self.tt_hits += 1
+        if cutoff:
+            self.tt_cutoffs += 1
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + time.perf_counter() - started
+
+    @property
+    def nodes(self):
+        return sum(self.nodes_by_ply)
+
+    @property
+    def first_move_cutoff_rate(self):
+        """Share of cutoffs produced by the first move searched (ordering quality)."""
+        return self.cutoff_index.get(0, 0) / self.cutoffs if self.cutoffs else 0.0
+
+    @property
+    def tt_hit_rate(self):
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    def as_dict(self):
+        return {
+            'nodes': self.nodes,
+            'nodes_by_ply': list(self.nodes_by_ply),
+            'cutoffs': self.cutoffs,
+            'first_move_cutoff_rate': self.first_move_cutoff_rate,
+            'evaluations': self.evaluations,
+            'tt_probes': self.tt_probes,
+            'tt_hit_rate': self.tt_hit_rate,
+            'tt_cutoffs': self.tt_cutoffs,
+            'phase_times': dict(self.phase_times),
+        }
+
+    def summary(self):
+        """One-line human-readable summary (used by the GUI)."""
+        total = sum(self.phase_times.values())
+        return (f"{self.nodes:,} nodes  {total:.2f}s  cut@1st {100 * self.first_move_cutoff_rate:.0f}%  "
+                f"TT {100 * self.tt_hit_rate:.0f}%  evals {self.evaluations:,}")
+
+
+def phase(stats, name):
+    """stats.phase(name), or a no-op context when stats is None."""
+    return stats.phase(name) if stats is not None else nullcontext()
@@ -0,0 +1,291 @@
+from core.board import stones
+from core.rule import DIRECTIONS, RunTable
+from core.zobrist import zobrist_for
+
+_line_neighbours = {}
+
+
+def line_neighbours(size):
+    """For every flat index, the cells within 4 steps along each of the four lines through it.
+
+    Returns table[i][d] -> list of (x, y) ordered from -4 to +4 along DIRECTIONS[d].
+    """
+    table = _line_neighbours.get(size)
+    if table is not None:
+        return table
+    table = []
+    for y in range(size):
+        for x in range(size):
+            lines = []
+            for dx, dy in DIRECTIONS:
+                cells = []
+                for k in (-4, -3, -2, -1, 1, 2, 3, 4):
+                    nx, ny = x + k * dx, y + k * dy
+                    if 0 <= nx < size and 0 <= ny < size:
+                        cells.append((nx, ny))
+                lines.append(cells)
+            table.append(lines)
+    _line_neighbours[size] = table
+    return table
+
+
+class ThreatSearch:
+    """
+    Threat-space search for forced wins.
+
+    VCF (victory by continuous fours) only lets the attacker play moves that
+    make a four, so the defender's reply is forced to the completion cell. VCT
+    (victory by continuous threats) additionally allows live threes when the
+    defender has no four of their own, and tries every defending cell.
+    Results are cached per (Zobrist key, attacker, kind) across calls; the
+    cache is cleared when it exceeds max_cache entries. max_nodes bounds the
+    work of a single call.
+    """
+
+    def __init__(self, max_cache=200000, max_nodes=2000):
+        self.max_cache = max_cache
+        self.max_nodes = max_nodes
+        self.cache = {}
+
+    def vcf(self, grid, player, max_depth=12):
+        """Return a winning sequence of continuous fours for player, or None.
+
+        The sequence alternates player's moves and the forced replies and ends
+        with player's five.
+        """
+        return self._run(grid, player, max_depth, self._vcf)
+
+    def vct(self, grid, player, max_depth=6):
+        """Return a winning sequence of fours and threes for player, or None.
+
+        Only the main line is returned: for threes the first defending cell
+        is shown, although every defence was refuted. A VCF is tried first
+        since it is much cheaper to find.
+        """
+        return self._run(grid, player, 2 * max_depth, self._vcf) or self._run(grid, player, max_depth, self._vct)
+
+    def _run(self, grid, player, max_depth, search):
+        self.grid = grid
+        self.size = len(grid)
+        self.runs = RunTable.from_grid(grid)
+        self.zobrist = zobrist_for(self.size)
+        self.key = self.zobrist.hash_grid(grid)
+        self.near = line_neighbours(self.size)
+        self.nodes = 0
+        self.aborted = False
+        five = self._five_move(player)
+        if five is not None:
+            return [five]
+        if self._five_move(3 - player) is not None:
+            return None  # the opponent's five must be blocked first
+        if len(self.cache) > self.max_cache:
+            self.cache.clear()
+        return search(player, max_depth)
+
+    def _place(self, x, y, player):
+        self.grid[y][x] = player
+        self.runs.place(x, y, player)
+        self.key = self.zobrist.toggle(self.key, x, y, player)
+
+    def _remove(self, x, y):
+        self.key = self.zobrist.toggle(self.key, x, y, self.grid[y][x])
+        self.runs.remove(x, y)
+        self.grid[y][x] = 0
+
+    def _completions(self, x, y, player):
+        """Empty cells on the lines through (x,y) where player would make five."""
+        grid = self.grid
+        makes_five = self.runs.makes_five
+        return [(cx, cy) for line in self.near[y * self.size + x] for cx, cy in line
+                if grid[cy][cx] == 0 and makes_five(cx, cy, player)]
+
+    def _three_lines(self, x, y, player):
+        """Directions in which (x,y) lies in a 5-window holding 3+ of player's stones and no others."""
+        grid = self.grid
+        size = self.size
+        found = []
+        for d, (dx, dy) in enumerate(DIRECTIONS):
+            for start in range(-4, 1):
+                count = 0
+                for k in range(start, start + 5):
+                    nx, ny = x + k * dx, y + k * dy
+                    if not (0 <= nx < size and 0 <= ny < size):
+                        count = -1
+                        break
+                    v = grid[ny][nx]
+                    if v == player:
+                        count += 1
+                    elif v != 0:
+                        count = -1
+                        break
+                if count >= 3:
+                    found.append(d)
+                    break
+        return found
+
+    def _attack_cells(self, player):
+        """Empty cells sharing a line (within 4) with one of player's stones, row-major."""
+        grid = self.grid
+        size = self.size
+        cells = set()
+        for x, y, v in stones(grid):
+            if v == player:
+                for line in self.near[y * size + x]:
+                    for cx, cy in line:
+                        if grid[cy][cx] == 0:
+                            cells.add((cy, cx))
+        return [(x, y) for y, x in sorted(cells)]
+
+    def _five_move(self, player):
+        makes_five = self.runs.makes_five
+        for x, y in self._attack_cells(player):
+            if makes_five(x, y, player):
+                return (x, y)
+        return None
+
+    def _four_moves(self, player):
+        """(move, completion cells) for every move that makes at least one four."""
+        fours = []
+        for x, y in self._attack_cells(player):
+            self._place(x, y, player)
+            completions = self._completions(x, y, player)
+            self._remove(x, y)
+            if completions:
+                fours.append(((x, y), completions))
+        return fours
+
+    def _open_four_moves(self, x, y, player, directions):
+        """Moves on the given lines through (x,y) that leave player two or more completions."""
+        moves = []
+        lines = self.near[y * self.size + x]
+        for cx, cy in (cell for d in directions for cell in lines[d]):
+            if self.grid[cy][cx] == 0:
+                self._place(cx, cy, player)
+                if len(self._completions(cx, cy, player)) >= 2:
+                    moves.append((cx, cy))
+                self._remove(cx, cy)
+        return moves
+
+    def _enter(self, kind, player, depth):
+        """Node bookkeeping; returns (cache_key, cached) where cached is (hit, result)."""
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            self.aborted = True
+            return None, (True, None)
+        cache_key = (self.key, player, kind)
+        entry = self.cache.get(cache_key)
+        if entry is not None and (entry[1] is not None or entry[0] >= depth):
+            return cache_key, (True, entry[1])
+        return cache_key, (False, None)
+
+    def _store(self, cache_key, depth, result):
+        if result is not None or not self.aborted:
+            self.cache[cache_key] = (depth, result)
+        return result
+
+    def _after_block(self, bx, by, attacker, depth, search):
+        """Continue after the defender's stone at (bx,by)."""
+        if self._completions(bx, by, 3 - attacker):
+            # the defender now threatens five: only an immediate five still wins
+            five = self._five_move(attacker)
+            return [five] if five is not None else None
+        return search(attacker, depth - 1)
+
+    def _forcing_fours(self, attacker, depth, search):
+        """Try every four for attacker, recursing with `search` after the forced block."""
+        defender = 3 - attacker
+        for (mx, my), completions in self._four_moves(attacker):
+            if len(completions) >= 2:
+                # open four or double four: one block cannot stop both
+                (ax, ay), (bx, by) = completions[0], completions[1]
+                return [(mx, my), (ax, ay), (bx, by)]
+            self._place(mx, my, attacker)
+            bx, by = completions[0]
+            self._place(bx, by, defender)
+            sub = self._after_block(bx, by, attacker, depth, search)
+            self._remove(bx, by)
+            self._remove(mx, my)
+            if sub:
+                return [(mx, my), (bx, by)] + sub
+            if self.aborted:
+                return None
+        return None
+
+    def _vcf(self, attacker, depth):
+        cache_key, (hit, cached) = self._enter('vcf', attacker, depth)
+        if hit:
+            return cached
+        five = self._five_move(attacker)
+        if five is not None:
+            return self._store(cache_key, depth, [five])
+        if depth == 0:
+            return self._store(cache_key, depth, None)
+        return self._store(cache_key, depth, self._forcing_fours(attacker, depth, self._vcf))
+
+    def _vct(self, attacker, depth):
+        cache_key, (hit, cached) = self._enter('vct', attacker, depth)
+        if hit:
+            return cached
+        five = self._five_move(attacker)
+        if five is not None:
+            return self._store(cache_key, depth, [five])
+        if depth == 0:
+            return self._store(cache_key, depth, None)
+        result = self._forcing_fours(attacker, depth, self._vct)
+        if result is None and not self.aborted:
+            result = self._threes(attacker, depth)
+        return self._store(cache_key, depth, result)
+
+    def _threes(self, attacker, depth):
+        """Try live threes; only forcing while the defender has no four to answer with."""
+        defender = 3 - attacker
+        if self._four_moves(defender):
+            return None
+        for mx, my in self._attack_cells(attacker):
+            self._place(mx, my, attacker)
+            directions = self._three_lines(mx, my, attacker)
+            threats = self._open_four_moves(mx, my, attacker, directions) if directions else None
+            if not threats:
+                self._remove(mx, my)
+                continue
+            # defending cells: those that leave no open four on the three's lines
+            defences = []
+            lines = self.near[my * self.size + mx]
+            for cx, cy in (cell for d in directions for cell in lines[d]):
+                if self.grid[cy][cx] == 0:
+                    self._place(cx, cy, defender)
+                    if not self._open_four_moves(mx, my, attacker, directions):
+                        defences.append((cx, cy))
+                    self._remove(cx, cy)
+            if not defences:
+                # nothing on these lines stops it; any reply loses to the open four
+                defences = threats[:1]
+            line = None
+            for bx, by in defences:
+                self._place(bx, by, defender)
+                sub = self._vct(attacker, depth - 1)
+                self._remove(bx, by)
+                if not sub:
+                    line = None
+                    break
+                if line is None:
+                    line = [(mx, my), (bx, by)] + sub
+            self._remove(mx, my)
+            if line:
+                return line
+            if self.aborted:
+                return None
+        return None
+
+
+_default_search = ThreatSearch()
+
+
+def find_vcf(grid, player, max_depth=12):
+    """Forced win by continuous fours for player, as a move sequence, or None."""
+    return _default_search.vcf(grid, player, max_depth)
+
+
+def find_vct(grid, player, max_depth=6):
+    """Forced win by fours and threes for player, as a main-line move sequence, or None."""
+    return _default_search.vct(grid, player, max_depth)
@@ -0,0 +1,48 @@
+# Bound types for stored scores
+EXACT = 0
+LOWER = 1  # search failed high: true score >= stored score
+UPPER = 2  # search failed low: true score <= stored score
+
+# Rough per-slot cost of a stored entry tuple in CPython, used to size the table.
+ENTRY_BYTES = 128
+
+
+class TranspositionTable:
+    """Fixed-size table of search results keyed by Zobrist key.
+
+    Each slot holds one entry (key, depth, flag, score, move, generation) and is
+    indexed by the low bits of the key. A new result replaces the slot's entry
+    when the slot is empty, the old entry comes from an earlier search
+    (generation) or the new result is searched at least as deep.
+    """
+
+    def __init__(self, memory_mb=32):
+        slots = max(1, int(memory_mb * 1024 * 1024) // ENTRY_BYTES)
+        slots = 1 << (slots.bit_length() - 1)  # round down to a power of two
+        self.mask = slots - 1
+        self.slots = [None] * slots
+        self.generation = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+        self.generation = 0
+
+    def new_search(self):
+        """Age existing entries so the next search may overwrite them freely."""
+        self.generation += 1
+
+    def probe(self, key):
+        """Return (depth, flag, score, move) stored for key, or None."""
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry[1:5]
+        return None
+
+    def store(self, key, depth, flag, score, move):
+        i = key & self.mask
+        old = self.slots[i]
+        if old is None or old[5] != self.generation or depth >= old[1]:
+            self.slots[i] = (key, depth, flag, score, move, self.generation)
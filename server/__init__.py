@@ -0,0 +1 @@
+"""Network front end for Gomoku."""
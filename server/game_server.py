@@ -0,0 +1,293 @@
+"""Local asyncio game server: many Game sessions, AI moves on a bounded process pool.
+
+Protocol: one JSON object per line over TCP, answered by one JSON line.
+    {"op": "new", "size": 15, "ai": "alpha_beta_plus", "ai_player": 2, "depth": 4, "rules": "renju"}
+    {"op": "move", "session": "...", "x": 7, "y": 7}    # human move, then the AI replies
+    {"op": "ai_move", "session": "..."}                 # ask the AI to move (e.g. AI plays black)
+    {"op": "state", "session": "..."}
+    {"op": "close", "session": "..."}
+Every reply has "ok"; failures carry "error" ('busy', 'timeout', 'illegal move', 'AI failed: ...', ...).
+After 'busy' or 'timeout' the human move stands and the AI is still to move:
+retry with ai_move. An optional "id" field is echoed back.
+
+Example:
+    python -m server.game_server --port 8765 --workers 4
+"""
+import argparse
+import asyncio
+import json
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from core.game import Game
+from core.rule import get_rules
+from players import random as random_ai
+from players import alpha_beta as alpha_beta_ai
+from players import alpha_beta_plus as alpha_beta_plus_ai
+
+AI_MODULES = {
+    'random': random_ai,
+    'alpha_beta': alpha_beta_ai,
+    'alpha_beta_plus': alpha_beta_plus_ai,
+}
+
+# Share of the request timeout given to alpha_beta_plus as its own search time limit
+TIME_LIMIT_SHARE = 0.8
+# Search depths a client may ask for; deeper searches could hold a worker for hours
+MIN_DEPTH, MAX_DEPTH = 1, 6
+
+
+def _ai_move(ai_type, grid, player, depth, time_limit, rules):
+    # runs in a pool process
+    module = AI_MODULES[ai_type]
+    if ai_type == 'random':
+        return module.get_move(grid, player, rules=rules)
+    options = {'rules': rules} if depth is None else {'depth': depth, 'rules': rules}
+    if ai_type == 'alpha_beta_plus' and time_limit is not None:
+        options['time_limit'] = time_limit
+    return module.get_move(grid, player, **options)
+
+
+class Session:
+    """One game hosted by the server; `lock` serialises requests on it."""
+
+    def __init__(self, size, ai_type, ai_player, depth, rules=None):
+        self.game = Game(size, rules=rules)
+        self.ai_type = ai_type
+        self.ai_player = ai_player
+        self.depth = depth
+        self.lock = asyncio.Lock()
+
+    def state(self):
+        game = self.game
+        return {
+            'size': game.size,
+            'grid': [list(row) for row in game.board.grid],
+            'current_player': game.current_player,
+            'winner': game.winner,
+            'win_line': game.win_line,
+            'last_move': game.last_move,
+            'full': game.is_full(),
+            'rules': game.rules.name,
+        }
+
+
+class RequestError(Exception):
+    """A request that is answered with {"ok": false, "error": str(exc)}."""
+
+
+class GameServer:
+    """
+    Hosts Game sessions for TCP clients. AI searches run on a process pool of
+    `workers` processes; at most `max_pending` searches may be queued or
+    running, and a request that cannot get a slot within `timeout` seconds is
+    refused with 'busy' (backpressure). A search still unfinished after
+    `timeout` seconds is answered with 'timeout' and keeps its slot until the
+    worker is done, so a slow search never lets the queue grow unbounded.
+    alpha_beta_plus searches also get TIME_LIMIT_SHARE of the timeout as
+    their own time limit, so they normally finish in time.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8765, workers=2, timeout=10.0, max_pending=None,
+                 max_sessions=1000):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.timeout = timeout
+        self.max_sessions = max_sessions
+        self.slots = asyncio.Semaphore(max_pending or 2 * workers)
+        self.sessions = {}
+        self.clients = {}  # writer -> handler task
+        self.pool = None
+        self.server = None
+
+    async def start(self):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]  # resolves port=0
+        return self
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            for writer in list(self.clients):
+                writer.close()
+            await asyncio.gather(*self.clients.values(), return_exceptions=True)
+            await self.server.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    async def handle_client(self, reader, writer):
+        self.clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                reply = await self.dispatch(line)
+                writer.write(json.dumps(reply).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clients.pop(writer, None)
+            writer.close()
+
+    async def dispatch(self, line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError('request must be a JSON object')
+            request_id = request.get('id')
+            handler = getattr(self, 'op_' + str(request.get('op')), None)
+            if handler is None:
+                raise RequestError(f"unknown op {request.get('op')!r}")
+            reply = await handler(request)
+            reply['ok'] = True
+        except (RequestError, ValueError, TypeError, KeyError) as exc:
+            reply = {'ok': False, 'error': str(exc)}
+        if request_id is not None:
+            reply['id'] = request_id
+        return reply
+
+    def _session(self, request):
+        session = self.sessions.get(request.get('session'))
+        if session is None:
+            raise RequestError('unknown session')
+        return session
+
+    async def op_new(self, request):
+        if len(self.sessions) >= self.max_sessions:
+            raise RequestError('too many sessions')
+        ai_type = request.get('ai', 'alpha_beta_plus')
+        if ai_type is not None and ai_type not in AI_MODULES:
+            raise RequestError(f"unknown ai {ai_type!r}")
+        size = int(request.get('size', 15))
+        if not 5 <= size <= 50:
+            raise RequestError('size must be between 5 and 50')
+        depth = request.get('depth')
+        if depth is not None:
+            depth = int(depth)
+            if not MIN_DEPTH <= depth <= MAX_DEPTH:
+                raise RequestError(f'depth must be between {MIN_DEPTH} and {MAX_DEPTH}')
+        ai_player = int(request.get('ai_player', 2))
+        if ai_player not in (1, 2):
+            raise RequestError('ai_player must be 1 or 2')
+        rules = get_rules(request.get('rules')).name
+        session = Session(size, ai_type, ai_player, depth, rules)
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = session
+        return {'session': session_id, 'state': session.state()}
+
+    async def op_state(self, request):
+        return {'state': self._session(request).state()}
+
+    async def op_close(self, request):
+        self._session(request)
+        del self.sessions[request['session']]
+        return {}
+
+    async def op_move(self, request):
+        session = self._session(request)
+        async with session.lock:
+            game = session.game
+            if game.winner != 0:
+                raise RequestError('game over')
+            if session.ai_type is not None and game.current_player == session.ai_player:
+                raise RequestError('not your turn')
+            placed, _ = game.play_move(int(request['x']), int(request['y']))
+            if not placed:
+                raise RequestError('illegal move')
+            reply = {}
+            if session.ai_type is not None and game.winner == 0 and not game.is_full():
+                reply['ai_move'] = await self._play_ai(session)
+            reply['state'] = session.state()
+            return reply
+
+    async def op_ai_move(self, request):
+        session = self._session(request)
+        async with session.lock:
+            game = session.game
+            if session.ai_type is None or game.current_player != session.ai_player:
+                raise RequestError('not the AI turn')
+            if game.winner != 0 or game.is_full():
+                raise RequestError('game over')
+            return {'ai_move': await self._play_ai(session), 'state': session.state()}
+
+    def _replace_pool(self, broken):
+        """Swap in a new process pool for `broken` (once, however many requests saw it break)."""
+        if self.pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    async def _play_ai(self, session):
+        """Search on the pool within the timeout and play the move on the session's game."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        try:
+            await asyncio.wait_for(self.slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            raise RequestError('busy') from None
+        game = session.game
+        time_limit = None
+        if session.ai_type == 'alpha_beta_plus':
+            time_limit = max(0.05, TIME_LIMIT_SHARE * (deadline - loop.time()))
+        pool = self.pool
+        try:
+            future = loop.run_in_executor(pool, _ai_move, session.ai_type,
+                                          [list(row) for row in game.board.grid], game.current_player,
+                                          session.depth, time_limit, game.rules.name)
+        except BrokenProcessPool as exc:
+            self.slots.release()
+            self._replace_pool(pool)
+            raise RequestError(f'AI failed: {type(exc).__name__}: {exc}') from None
+        # the slot is held until the worker is really free, even after a timeout
+        future.add_done_callback(lambda _: self.slots.release())
+        try:
+            move = await asyncio.wait_for(asyncio.shield(future), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            raise RequestError('timeout') from None
+        except Exception as exc:  # raised in the pool: an engine error or a dead worker
+            if isinstance(exc, BrokenProcessPool):
+                self._replace_pool(pool)
+            raise RequestError(f'AI failed: {type(exc).__name__}: {exc}') from None
+        if move is None:
+            raise RequestError('AI found no move')
+        placed, _ = game.play_move(*move)
+        if not placed:
+            raise RequestError('AI move refused')
+        return list(move)
+
+
+async def serve(host, port, workers, timeout, max_pending):
+    server = await GameServer(host, port, workers, timeout, max_pending).start()
+    print(f"serving on {server.host}:{server.port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gomoku game server (JSON lines over TCP)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=2, help='AI search processes')
+    parser.add_argument('--timeout', type=float, default=10.0, help='seconds per AI move request')
+    parser.add_argument('--max-pending', type=int, default=None,
+                        help='AI searches queued or running before requests wait (default: 2 x workers)')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.timeout, args.max_pending))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
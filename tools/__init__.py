@@ -0,0 +1 @@
+"""Headless tools (self-play, benchmarks) for Gomoku."""
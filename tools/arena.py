@@ -0,0 +1,210 @@
+"""Headless engine-vs-engine arena.
+
+Example:
+    python -m tools.arena alpha_beta_plus:3 alpha_beta:2 --games 200 --workers 8
+"""
+import argparse
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.game import Game
+from core.record import GameWriter
+from players import random as random_ai
+from players import alpha_beta as alpha_beta_ai
+from players import alpha_beta_plus as alpha_beta_plus_ai
+from players import mcts as mcts_ai
+from players.analysis_cache import AnalysisCache
+
+ENGINES = {
+    'random': random_ai,
+    'alpha_beta': alpha_beta_ai,
+    'alpha_beta_plus': alpha_beta_plus_ai,
+    'mcts': mcts_ai,
+}
+
+
+def parse_engine(spec):
+    """'name' or 'name:depth' -> (name, depth or None); for mcts the number is its iteration budget."""
+    name, _, depth = spec.partition(':')
+    if name not in ENGINES:
+        raise ValueError(f"unknown engine {name!r}; choose from {', '.join(ENGINES)}")
+    return name, int(depth) if depth else None
+
+
+_caches = {}
+
+
+def engine_move(spec, grid, player, cache_path=None, rules=None):
+    name, depth = parse_engine(spec)
+    module = ENGINES[name]
+    options = {} if rules is None else {'rules': rules}
+    if depth is not None:
+        options['depth'] = depth
+    if cache_path and name == 'alpha_beta_plus':
+        if cache_path not in _caches:
+            _caches[cache_path] = AnalysisCache(cache_path)
+        options['cache'] = _caches[cache_path]
+    if name == 'random':
+        return module.get_move(grid, player, rules=rules)
+    if name == 'mcts':
+        return module.get_move(grid, player, iterations=depth, rules=rules)
+    return module.get_move(grid, player, **options)
+
+
+def play_game(black, white, seed=0, opening_moves=2, size=15, cache_path=None, rules=None):
+    """
+    Play one game between engine specs `black` and `white`.
+    The first `opening_moves` stones are placed at random near the centre
+    (chosen with `seed`, which also seeds the random engine).
+    cache_path: AnalysisCache file shared by the alpha_beta_plus engines.
+    rules: rule set name (see core.rule) used by the game and the engines.
+    Returns dict(winner=0/1/2, moves=int, times={1: [...], 2: [...]},
+    history=[(x, y), ...]).
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    game = Game(size, rules=rules)
+    history = []
+    center = size // 2
+    near = [(x, y) for y in range(center - 2, center + 3) for x in range(center - 2, center + 3)
+            if 0 <= x < size and 0 <= y < size]
+    for _ in range(opening_moves):
+        x, y = rng.choice([c for c in near if game.board.grid[c[1]][c[0]] == 0])
+        if game.play_move(x, y)[0]:
+            history.append((x, y))
+    specs = {1: black, 2: white}
+    times = {1: [], 2: []}
+    moves = opening_moves
+    while game.winner == 0 and not game.is_full():
+        player = game.current_player
+        grid = [list(row) for row in game.board.grid]
+        started = time.perf_counter()
+        move = engine_move(specs[player], grid, player, cache_path, rules)
+        times[player].append(time.perf_counter() - started)
+        if move is None:
+            break
+        placed, _ = game.play_move(*move)
+        if not placed:
+            game.winner = 3 - player  # illegal move forfeits
+            break
+        history.append(tuple(move))
+        moves += 1
+    return {'winner': game.winner, 'moves': moves, 'times': times, 'history': history}
+
+
+def _play(task):
+    return play_game(*task)
+
+
+def elo_estimate(wins, draws, losses, z=1.96):
+    """Elo difference implied by a match score, with a normal-approximation interval.
+
+    Returns (elo, low, high); values are +/-inf when the score is 0% or 100%.
+    """
+    n = wins + draws + losses
+    if n == 0:
+        return 0.0, float('-inf'), float('inf')
+
+    def to_elo(score):
+        if score <= 0:
+            return float('-inf')
+        if score >= 1:
+            return float('inf')
+        return -400 * math.log10(1 / score - 1)
+
+    score = (wins + 0.5 * draws) / n
+    variance = (wins * (1 - score) ** 2 + draws * (0.5 - score) ** 2 + losses * score ** 2) / n
+    margin = z * math.sqrt(variance / n)
+    return to_elo(score), to_elo(score - margin), to_elo(score + margin)
+
+
+def run_match(engine_a, engine_b, games=100, workers=None, opening_moves=2, size=15, seed=0,
+              cache_path=None, record_path=None, rules=None):
+    """
+    Play `games` games between two engine specs on a process pool, alternating
+    colours (engine_a is black in even-numbered games). With cache_path the
+    alpha_beta_plus engines share a persistent AnalysisCache; with record_path
+    every game is appended to that game archive (see core.record). `rules`
+    names the rule set (see core.rule) for all games.
+    Returns a summary dict with wins/draws/losses from engine_a's point of view,
+    Elo estimate and interval, average move times and average game length.
+    """
+    parse_engine(engine_a)
+    parse_engine(engine_b)
+    tasks = []
+    for i in range(games):
+        black, white = (engine_a, engine_b) if i % 2 == 0 else (engine_b, engine_a)
+        tasks.append((black, white, seed + i, opening_moves, size, cache_path, rules))
+    wins = draws = losses = 0
+    move_times = {engine_a: [], engine_b: []} if engine_a != engine_b else {engine_a: []}
+    total_moves = 0
+    writer = GameWriter(record_path) if record_path else None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for i, result in enumerate(pool.map(_play, tasks, chunksize=max(1, games // 64))):
+            if writer is not None:
+                writer.write_game(size, 1, result['history'], result['winner'], rules)
+            a_color = 1 if i % 2 == 0 else 2
+            if result['winner'] == 0:
+                draws += 1
+            elif result['winner'] == a_color:
+                wins += 1
+            else:
+                losses += 1
+            total_moves += result['moves']
+            move_times[engine_a].extend(result['times'][a_color])
+            move_times[engine_b].extend(result['times'][3 - a_color])
+    if writer is not None:
+        writer.close()
+    elo, low, high = elo_estimate(wins, draws, losses)
+    return {
+        'engine_a': engine_a,
+        'engine_b': engine_b,
+        'games': games,
+        'wins': wins,
+        'draws': draws,
+        'losses': losses,
+        'elo': elo,
+        'elo_low': low,
+        'elo_high': high,
+        'avg_move_time': {name: (sum(t) / len(t) if t else 0.0) for name, t in move_times.items()},
+        'avg_game_length': total_moves / games if games else 0.0,
+    }
+
+
+def format_summary(summary):
+    n = summary['games'] or 1
+    lines = [
+        f"{summary['engine_a']} vs {summary['engine_b']}: {summary['games']} games",
+        f"  wins {summary['wins']} ({100 * summary['wins'] / n:.1f}%)  "
+        f"draws {summary['draws']} ({100 * summary['draws'] / n:.1f}%)  "
+        f"losses {summary['losses']} ({100 * summary['losses'] / n:.1f}%)",
+        f"  Elo {summary['elo']:+.0f}  (95% CI {summary['elo_low']:+.0f} .. {summary['elo_high']:+.0f})",
+        f"  average game length {summary['avg_game_length']:.1f} moves",
+    ]
+    for name, t in summary['avg_move_time'].items():
+        lines.append(f"  {name}: {1000 * t:.1f} ms/move")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless Gomoku engine arena')
+    parser.add_argument('engine_a', help="engine spec, e.g. alpha_beta_plus or alpha_beta_plus:3")
+    parser.add_argument('engine_b')
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None, help='processes (default: CPU count)')
+    parser.add_argument('--opening-moves', type=int, default=2, help='random stones before the engines play')
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cache', help='persistent analysis cache file for alpha_beta_plus')
+    parser.add_argument('--record', help='append every game to this game archive')
+    parser.add_argument('--rules', choices=['freestyle', 'standard', 'renju'], default='freestyle')
+    args = parser.parse_args(argv)
+    summary = run_match(args.engine_a, args.engine_b, args.games, args.workers,
+                        args.opening_moves, args.size, args.seed, args.cache, args.record, args.rules)
+    print(format_summary(summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""Fixed-position benchmark for the player engines.
+
+Example:
+    python -m tools.benchmark alpha_beta_plus:4 alpha_beta:3 --repeat 3 --json bench.json
+    python -m tools.benchmark alpha_beta_plus:4 --compare bench.json
+"""
+import argparse
+import json
+import time
+
+from players.stats import SearchStats
+from tools.arena import ENGINES, parse_engine
+from tools.positions import POSITIONS, to_grid
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def search_position(spec, position):
+    """Run one engine on one position. Returns (move, seconds, SearchStats).
+    mcts takes the spec number as its iteration budget, plays with a fixed seed
+    and reports no search statistics (its nodes count stays 0)."""
+    name, depth = parse_engine(spec)
+    module = ENGINES[name]
+    grid = to_grid(position)
+    player = position['to_move']
+    stats = SearchStats()
+
+    started = time.perf_counter()
+    if name == 'random':
+        move = module.get_move(grid, player)
+    elif name == 'mcts':
+        move = module.get_move(grid, player, iterations=depth, seed=0)
+    elif depth is None:
+        move = module.get_move(grid, player, stats=stats)
+    else:
+        move = module.get_move(grid, player, depth=depth, stats=stats)
+    elapsed = time.perf_counter() - started
+    return move, elapsed, stats
+
+
+def run_engine(spec, positions=POSITIONS, repeat=1):
+    """Benchmark one engine spec over the positions; returns a JSON-ready dict."""
+    results = []
+    times = []
+    total_nodes = 0
+    total_time = 0.0
+    for position in positions:
+        runs = [search_position(spec, position) for _ in range(repeat)]
+        move, _, stats = runs[0]
+        nodes = stats.nodes
+        run_times = [t for _, t, _ in runs]
+        times.extend(run_times)
+        total_nodes += nodes * repeat
+        total_time += sum(run_times)
+        best = position.get('best')
+        results.append({
+            'name': position['name'],
+            'category': position['category'],
+            'move': list(move) if move else None,
+            'nodes': nodes,
+            'first_move_cutoff_rate': stats.first_move_cutoff_rate,
+            'tt_hit_rate': stats.tt_hit_rate,
+            'time': min(run_times),
+            'solved': (tuple(move) in [tuple(m) for m in best]) if best else None,
+        })
+    tactical = [r for r in results if r['solved'] is not None]
+    return {
+        'engine': spec,
+        'repeat': repeat,
+        'positions': results,
+        'nodes': total_nodes,
+        'nodes_per_second': total_nodes / total_time if total_time else 0.0,
+        'time_p50': percentile(times, 50),
+        'time_p90': percentile(times, 90),
+        'time_max': max(times),
+        'solved': sum(1 for r in tactical if r['solved']),
+        'tactical': len(tactical),
+    }
+
+
+def compare(current, previous):
+    """Lines comparing a run against an earlier JSON report of the same engine."""
+    lines = []
+    old_moves = {p['name']: p['move'] for p in previous['positions']}
+    same = sum(1 for p in current['positions'] if old_moves.get(p['name']) == p['move'])
+    lines.append(f"  vs previous: best-move agreement {same}/{len(current['positions'])}")
+    for key in ('nodes', 'time_p50', 'time_p90'):
+        if previous.get(key):
+            lines.append(f"  {key}: {previous[key]:.4g} -> {current[key]:.4g} ({current[key] / previous[key]:.2f}x)")
+    return lines
+
+
+def format_report(report):
+    lines = [
+        f"{report['engine']}: {len(report['positions'])} positions x {report['repeat']}",
+        f"  nodes {report['nodes']:,}  ({report['nodes_per_second']:,.0f} nodes/s)",
+        f"  time-to-move p50 {1000 * report['time_p50']:.1f} ms  p90 {1000 * report['time_p90']:.1f} ms  "
+        f"max {1000 * report['time_max']:.1f} ms",
+        f"  tactical solved {report['solved']}/{report['tactical']}",
+    ]
+    for p in report['positions']:
+        mark = '' if p['solved'] is None else (' ok' if p['solved'] else ' MISS')
+        lines.append(f"    {p['name']:<28} {str(p['move']):<10} {p['nodes']:>9,} nodes "
+                     f"{1000 * p['time']:>9.1f} ms  cut@1st {100 * p['first_move_cutoff_rate']:>3.0f}%  "
+                     f"TT {100 * p['tt_hit_rate']:>3.0f}%{mark}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fixed-position Gomoku engine benchmark')
+    parser.add_argument('engines', nargs='+', help='engine specs, e.g. alpha_beta_plus:4')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per position (for timing)')
+    parser.add_argument('--category', choices=['opening', 'middlegame', 'tactical'])
+    parser.add_argument('--json', help='write the reports to this file')
+    parser.add_argument('--compare', help='earlier --json output to compare against')
+    args = parser.parse_args(argv)
+    positions = [p for p in POSITIONS if args.category in (None, p['category'])]
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            previous = {r['engine']: r for r in json.load(f)}
+    reports = []
+    for spec in args.engines:
+        report = run_engine(spec, positions, args.repeat)
+        reports.append(report)
+        print(format_report(report))
+        if spec in previous:
+            print('\n'.join(compare(report, previous[spec])))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Build an opening book for alpha_beta_plus from deep offline searches.
+
+Example:
+    python -m tools.build_book --plies 6 --width 3 --depth 6 --workers 8
+"""
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from players.alpha_beta_plus import IncrementalEvaluator, get_strategic_candidates, search_root
+from players.book import DEFAULT_BOOK_PATH, canonical, to_canonical, write_book
+from players.search import HEURISTICS, SearchContext
+from players.transposition import TranspositionTable
+
+
+def search_position(grid, player, depth):
+    """(best move, score, candidates) of a fixed-depth alpha_beta_plus search."""
+    ctx = SearchContext(grid, TranspositionTable(), IncrementalEvaluator(grid), HEURISTICS)
+    candidates = get_strategic_candidates(grid, player, 3 - player, 12, ctx.runs, ctx.frontier)
+    move, score, _ = search_root(ctx, candidates, depth, player, 3 - player)
+    return move, score, candidates
+
+
+def _search_job(args):
+    return search_position(*args)
+
+
+def build(size=15, plies=4, width=3, depth=6, workers=None, progress=None):
+    """
+    Search every position reachable in `plies` moves from the empty board and
+    return the book entries {canonical key: (canonical move index, score)}.
+    Each position is expanded with its book move and the next `width` candidate
+    moves, so the book also covers replies the engine itself would not play.
+    Symmetric and transposed positions are searched once.
+    """
+    entries = {}
+    level = [[[0] * size for _ in range(size)]]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for ply in range(plies):
+            player = 1 if ply % 2 == 0 else 2
+            jobs = {}
+            for grid in level:
+                key, symmetry = canonical(grid, player)
+                if key not in entries and key not in jobs:
+                    jobs[key] = (grid, symmetry)
+            keys = list(jobs)
+            results = pool.map(_search_job, [(jobs[k][0], player, depth) for k in keys])
+            level = []
+            for key, (move, score, candidates) in zip(keys, results):
+                grid, symmetry = jobs[key]
+                entries[key] = (to_canonical(move, symmetry, size), max(-2 ** 31, min(2 ** 31 - 1, score)))
+                replies = [move] + [m for m in candidates if m != move][:width]
+                for x, y in replies:
+                    child = [row[:] for row in grid]
+                    child[y][x] = player
+                    level.append(child)
+            if progress is not None:
+                progress(ply + 1, len(entries))
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the alpha_beta_plus opening book')
+    parser.add_argument('--plies', type=int, default=4, help='book depth in moves from the empty board')
+    parser.add_argument('--width', type=int, default=3, help='alternative moves expanded per position')
+    parser.add_argument('--depth', type=int, default=6, help='search depth for each book position')
+    parser.add_argument('--size', type=int, default=15)
+    parser.add_argument('--workers', type=int, default=None, help='processes (default: CPU count)')
+    parser.add_argument('--output', default=DEFAULT_BOOK_PATH)
+    args = parser.parse_args(argv)
+    started = time.perf_counter()
+
+    def progress(ply, count):
+        print(f"ply {ply}: {count} positions ({time.perf_counter() - started:.1f}s)")
+
+    entries = build(args.size, args.plies, args.width, args.depth, args.workers, progress)
+    write_book(args.output, entries, args.size)
+    print(f"wrote {len(entries)} positions to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
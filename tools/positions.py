@@ -0,0 +1,238 @@
+"""Fixed benchmark positions.
+
+Each entry has a name, a category ('opening', 'middlegame' or 'tactical'), the
+player to move, a 15x15 diagram ('X' black = 1, 'O' white = 2, '.' empty) and,
+for tactical positions, the set of moves that solve it.
+"""
+
+POSITIONS = [
+    {
+        'name': 'opening-center',
+        'category': 'opening',
+        'to_move': 2,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '.......X.......',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'opening-direct',
+        'category': 'opening',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '.......XO......',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'opening-indirect',
+        'category': 'opening',
+        'to_move': 2,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '.......X.......',
+            '........O......',
+            '.......X.......',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'middlegame-a',
+        'category': 'middlegame',
+        'to_move': 2,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '........XXOO...',
+            '......O.X.O.O..',
+            '........O.X....',
+            '......X.XX.....',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'middlegame-b',
+        'category': 'middlegame',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '.....X.O.......',
+            '.......OXO.....',
+            '....O.OX.......',
+            '........XO.....',
+            '......XX.......',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'middlegame-c',
+        'category': 'middlegame',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '......OOO......',
+            '....X.O.XO.X...',
+            '......OOXX.....',
+            '.....O.XXX.....',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'middlegame-d',
+        'category': 'middlegame',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '......X.O.O....',
+            '........OO.....',
+            '......X..OOX...',
+            '......XX.O.....',
+            '.......X.......',
+            '.....X.........',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+    },
+    {
+        'name': 'tactical-open-three',
+        'category': 'tactical',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '.........O.....',
+            '...............',
+            '......XXX......',
+            '...............',
+            '.....O.........',
+            '..........O....',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+        'best': [(5, 7), (9, 7)],
+    },
+    {
+        'name': 'tactical-block-four',
+        'category': 'tactical',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...XOOOO.......',
+            '...............',
+            '......X........',
+            '.......X.......',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+        'best': [(8, 5)],
+    },
+    {
+        'name': 'tactical-block-open-three',
+        'category': 'tactical',
+        'to_move': 1,
+        'rows': [
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '.....X.........',
+            '......OOO......',
+            '........X......',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+            '...............',
+        ],
+        'best': [(5, 7), (9, 7)],
+    },
+]
+
+
+def to_grid(position):
+    """Fresh list-of-lists grid for a position (engines may mutate it)."""
+    codes = {'.': 0, 'X': 1, 'O': 2}
+    return [[codes[c] for c in row] for row in position['rows']]
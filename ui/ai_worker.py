@@ -0,0 +1,219 @@
+import multiprocessing
+import queue
+import time
+import traceback
+
+from players import random as random_ai
+from players import alpha_beta as alpha_beta_ai
+from players import alpha_beta_plus as alpha_beta_plus_ai
+from players.book import default_book
+from players.search import SearchContext
+from players.stats import SearchStats
+from players.transposition import TranspositionTable
+
+AI_MODULES = {
+	'random': random_ai,
+	'alpha_beta': alpha_beta_ai,
+	'alpha_beta_plus': alpha_beta_plus_ai,
+}
+
+# Human replies searched ahead while pondering, best-ranked first
+PONDER_MOVES = 4
+NOT_PLAYED = -1
+
+
+def _options(ai_type):
+	return {'book': default_book()} if ai_type == 'alpha_beta_plus' else {}
+
+
+def _search(ai_type, grid, player, nodes, results):
+	# runs in the worker process
+	def listener(ctx):
+		nodes.value = ctx.nodes
+
+	stats = error = None
+	try:
+		module = AI_MODULES[ai_type]
+		if ai_type == 'random':
+			move = module.get_move(grid, player)
+		else:
+			stats = SearchStats()
+			move = module.get_move(grid, player, listener=listener, stats=stats, **_options(ai_type))
+	except Exception:
+		move, error = None, traceback.format_exc()
+	results.put((move, stats, error))
+
+
+class PonderMiss(Exception):
+	"""The human played elsewhere; abandons the reply being pondered."""
+
+
+def predict_replies(grid, player, count=PONDER_MOVES):
+	"""player's most likely moves, ranked by a shallow alpha_beta_plus search."""
+	opponent = 3 - player
+	grid = [list(row) for row in grid]
+	ctx = SearchContext(grid, evaluator=alpha_beta_plus_ai.IncrementalEvaluator(grid))
+	candidates = alpha_beta_plus_ai.get_strategic_candidates(grid, player, opponent, 12, ctx.runs, ctx.frontier)
+	if not candidates:
+		return []
+	_, _, scores = alpha_beta_plus_ai.search_root(ctx, candidates, 2, player, opponent)
+	return sorted(scores, key=scores.get, reverse=True)[:count]
+
+
+def _ponder(ai_type, grid, player, played, nodes, results):
+	# runs in the worker process: search the AI's answer to each predicted human
+	# reply while `played` is NOT_PLAYED, then answer the move actually played
+	size = len(grid)
+	module = AI_MODULES[ai_type]
+	options = _options(ai_type)
+	tt = TranspositionTable()  # shared by all searches, so a miss still starts warm
+	answers = {}
+	current = [NOT_PLAYED]
+
+	def listener(ctx):
+		nodes.value = ctx.nodes
+		if played.value not in (NOT_PLAYED, current[0]):
+			raise PonderMiss()
+
+	try:
+		for x, y in predict_replies(grid, 3 - player):
+			if played.value != NOT_PLAYED:
+				break
+			current[0] = y * size + x
+			after = [list(row) for row in grid]
+			after[y][x] = 3 - player
+			stats = SearchStats()
+			try:
+				answers[current[0]] = module.get_move(after, player, tt=tt, listener=listener, stats=stats,
+													  **options), stats
+			except PonderMiss:
+				break
+			if played.value == current[0]:
+				break  # the search was finished for the move just played
+		current[0] = NOT_PLAYED
+		while played.value == NOT_PLAYED:
+			time.sleep(0.01)
+		index = played.value
+		if index in answers:
+			move, stats = answers[index]
+		else:
+			current[0] = index  # the listener must not take this search for a miss
+			after = [list(row) for row in grid]
+			after[index // size][index % size] = 3 - player
+			stats = SearchStats()
+			move = module.get_move(after, player, tt=tt, listener=listener, stats=stats, **options)
+	except Exception:
+		move, stats = None, None
+		error = traceback.format_exc()
+	else:
+		error = None
+	results.put((move, stats, error))
+
+
+class AIWorker:
+	"""Computes one AI move at a time in a background process.
+
+	The render loop calls start() once, then poll() every frame; cancel()
+	terminates a search that is no longer wanted (restart, menu, quit).
+	The search runs on a copy of the grid, so drawing never sees its stones.
+	`last_stats` holds the SearchStats of the last finished search (or None);
+	`last_error` the traceback of a search that failed instead of finishing.
+
+	ponder() uses the human's turn: a process searches the AI's answers to
+	the predicted human replies. When start() is then called with the
+	position after one of those replies, its answer is ready at once (or its
+	search simply continues); after any other reply the same process searches
+	the new position with the transposition table it has already filled.
+	"""
+
+	def __init__(self):
+		self.process = None
+		self.results = None
+		self.nodes = None
+		self.started = 0.0
+		self.last_stats = None
+		self.last_error = None
+		self.played = None
+		self.ponder_key = None  # (ai_type, player, grid) being pondered
+
+	@property
+	def busy(self):
+		"""True while a search for the AI's move runs."""
+		return self.process is not None and self.ponder_key is None
+
+	@property
+	def pondering(self):
+		return self.ponder_key is not None
+
+	def ponder(self, ai_type, grid, player):
+		"""Search answers to the human's likely replies; player is the AI."""
+		played = multiprocessing.Value('i', NOT_PLAYED, lock=False)
+		self._spawn(_ponder, ai_type, grid, player, played)
+		self.played = played
+		self.ponder_key = (ai_type, player, [list(row) for row in grid])
+
+	def start(self, ai_type, grid, player):
+		if self.pondering:
+			index = self._ponder_hit(ai_type, grid, player)
+			if index is not None:
+				self.played.value = index
+				self.ponder_key = None
+				self.started = time.perf_counter()
+				return
+		self._spawn(_search, ai_type, grid, player)
+
+	def _ponder_hit(self, ai_type, grid, player):
+		"""Flat index of the single human stone added since ponder(), or None."""
+		pondered_type, pondered_player, pondered = self.ponder_key
+		if (pondered_type, pondered_player) != (ai_type, player) or not self.process.is_alive():
+			return None
+		added = [(x, y) for y, row in enumerate(grid) for x, v in enumerate(row) if v != pondered[y][x]]
+		if len(added) != 1:
+			return None
+		x, y = added[0]
+		if pondered[y][x] != 0 or grid[y][x] != 3 - player:
+			return None
+		return y * len(grid) + x
+
+	def poll(self):
+		"""Return (finished, move); finished is True once per search."""
+		if not self.busy:
+			return False, None
+		try:
+			move, self.last_stats, self.last_error = self.results.get_nowait()
+		except queue.Empty:
+			if self.process.is_alive():
+				return False, None
+			move, self.last_error = None, 'AI process exited without a result'
+		self._cleanup()
+		return True, move
+
+	def _spawn(self, target, ai_type, grid, player, *extra):
+		self.cancel()
+		self.results = multiprocessing.Queue()
+		self.nodes = multiprocessing.Value('q', 0, lock=False)
+		grid = [list(row) for row in grid]
+		self.process = multiprocessing.Process(
+			target=target, args=(ai_type, grid, player, *extra, self.nodes, self.results), daemon=True)
+		self.process.start()
+		self.started = time.perf_counter()
+
+	def cancel(self):
+		if self.process is not None:
+			self.process.kill()  # not terminate(): a forked child keeps pygame's SIGTERM handler
+			self._cleanup()
+
+	def progress(self):
+		"""(elapsed seconds, nodes searched) of the running search."""
+		if self.process is None:
+			return 0.0, 0
+		return time.perf_counter() - self.started, self.nodes.value
+
+	def _cleanup(self):
+		self.process.join()
+		self.results.close()
+		self.process = None
+		self.results = None
+		self.nodes = None
+		self.played = None
+		self.ponder_key = None
@@ -1,3 +1,4 @@
+import argparse
 import os
 import sys
 import pygame
@@ -7,15 +8,14 @@ import pygame
 if __name__ == '__main__' and __package__ is None:
 	sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from players import random as random_ai
-from players import alpha_beta as alpha_beta_ai
-from players import alpha_beta_plus as alpha_beta_plus_ai
+from core.board import stones
 from core.game import Game
+from ui.ai_worker import AIWorker
 
 # -----------------
 # Global constants / variables
 # -----------------
-BOARD_SIZE = 15
+BOARD_SIZE = 15  # default; main(size) / --size picks another
 
 # Initial window size (will be resizable)
 INIT_WINDOW = 680
@@ -35,8 +35,8 @@ BOARD_PIXEL = CELL_SIZE * (BOARD_SIZE - 1)
 BOARD_ORIGIN_X = 0
 BOARD_ORIGIN_Y = TOP_BAR + MARGIN
 
-screen = pygame.display.set_mode((WINDOW_W, WINDOW_H), pygame.RESIZABLE | pygame.SWSURFACE)
-pygame.display.set_caption("Gomoku")
+# created in main() so importing this module (e.g. in an AI worker process) opens no window
+screen = None
 
 # clock
 clock = pygame.time.Clock()
@@ -61,6 +61,11 @@ ai_type = 'random'
 # UI transient state
 hover_cell = None
 ai_thinking = False  # flag to indicate AI is thinking
+ai_error = None  # message shown after a failed AI search; the AI stops until restart
+# background search for AI moves; keeps the event loop responsive
+ai_worker = AIWorker()
+show_stats = False  # 's' toggles the last search's statistics in the top bar
+ponder = True  # 'p' toggles searching ahead on the human's turn
 
 
 # Choose a font that supports CJK characters on Windows fallback list
@@ -74,6 +79,7 @@ def choose_font(names, size):
 	return pygame.font.Font(None, size)
 
 FONT = choose_font(['Microsoft JhengHei', 'Arial Unicode MS', 'Noto Sans CJK JP', None], 28)
+SMALL_FONT = choose_font(['Microsoft JhengHei', 'Arial Unicode MS', 'Noto Sans CJK JP', None], 18)
 BIG_FONT = choose_font(['Microsoft JhengHei', 'Arial Unicode MS', 'Noto Sans CJK JP', None], 48)
 
 
@@ -88,6 +94,77 @@ def update_layout(width, height):
 	BOARD_PIXEL = CELL_SIZE * (BOARD_SIZE - 1)
 	BOARD_ORIGIN_X = (WINDOW_W - BOARD_PIXEL) / 2
 	BOARD_ORIGIN_Y = TOP_BAR + MARGIN
+	_surfaces.clear()  # board, sprites and overlays depend on the layout
+
+
+# -----------------
+# Render caches
+# -----------------
+# Rendered labels, keyed by (font, text, colour); cleared when it grows past TEXT_CACHE_SIZE
+TEXT_CACHE_SIZE = 256
+_text_cache = {}
+# Layout-dependent surfaces (board, stone sprites, overlays), rebuilt after a resize
+_surfaces = {}
+
+
+def render_text(font, text, color):
+	"""font.render() of a label, cached because labels are redrawn on every frame that changes."""
+	key = (id(font), text, color)
+	surf = _text_cache.get(key)
+	if surf is None:
+		if len(_text_cache) >= TEXT_CACHE_SIZE:
+			_text_cache.clear()
+		surf = _text_cache[key] = font.render(text, True, color)
+	return surf
+
+
+def cached_surface(key, build):
+	surf = _surfaces.get(key)
+	if surf is None:
+		surf = _surfaces[key] = build()
+	return surf
+
+
+def stone_radius():
+	return max(2, int(CELL_SIZE // 2 - 2))
+
+
+def cell_center(x, y):
+	return int(BOARD_ORIGIN_X + x * CELL_SIZE), int(BOARD_ORIGIN_Y + y * CELL_SIZE)
+
+
+def cell_rect(cell):
+	"""Screen area a stone and its markers at cell may cover."""
+	cx, cy = cell_center(*cell)
+	r = stone_radius() + 8
+	return pygame.Rect(cx - r, cy - r, 2 * r + 1, 2 * r + 1)
+
+
+def build_board_surface():
+	surf = pygame.Surface((WINDOW_W, WINDOW_H)).convert()
+	# background
+	surf.fill((249, 214, 91))  # 木頭色
+	# top bar background
+	pygame.draw.rect(surf, (60, 60, 80), (0, 0, WINDOW_W, TOP_BAR))
+	# grid
+	for i in range(BOARD_SIZE):
+		x = BOARD_ORIGIN_X + i * CELL_SIZE
+		pygame.draw.line(surf, (0, 0, 0), (x, BOARD_ORIGIN_Y), (x, BOARD_ORIGIN_Y + CELL_SIZE * (BOARD_SIZE - 1)))
+		y = BOARD_ORIGIN_Y + i * CELL_SIZE
+		pygame.draw.line(surf, (0, 0, 0), (BOARD_ORIGIN_X, y), (BOARD_ORIGIN_X + CELL_SIZE * (BOARD_SIZE - 1), y))
+	return surf
+
+
+def circle_sprite(color, radius, width=0, pad=0):
+	"""Transparent surface with a circle centred on it; blit at center - radius - pad."""
+	side = 2 * (radius + pad) + 1
+	surf = pygame.Surface((side, side), pygame.SRCALPHA)
+	pygame.draw.circle(surf, color, (radius + pad, radius + pad), radius, width)
+	return surf
+
+
+def blit_centered(sprite, center):
+	screen.blit(sprite, (center[0] - sprite.get_width() // 2, center[1] - sprite.get_height() // 2))
 
 
 # -----------------
@@ -103,7 +180,7 @@ class Button:
 	def draw(self, surf):
 		pygame.draw.rect(surf, self.bg, self.rect)
 		pygame.draw.rect(surf, (0, 0, 0), self.rect, 2)
-		txt = FONT.render(self.text, True, self.fg)
+		txt = render_text(FONT, self.text, self.fg)
 		tw, th = txt.get_size()
 		surf.blit(txt, (self.rect.x + (self.rect.w - tw) // 2, self.rect.y + (self.rect.h - th) // 2))
 
@@ -126,58 +203,58 @@ def get_cell(pos):
 
 
 def draw_board():
-	# background
-	screen.fill((249, 214, 91))  # 木頭色
-	# top bar background
-	pygame.draw.rect(screen, (60, 60, 80), (0, 0, WINDOW_W, TOP_BAR))
-	# grid
-	for i in range(BOARD_SIZE):
-		x = BOARD_ORIGIN_X + i * CELL_SIZE
-		pygame.draw.line(screen, (0, 0, 0), (x, BOARD_ORIGIN_Y), (x, BOARD_ORIGIN_Y + CELL_SIZE * (BOARD_SIZE - 1)))
-		y = BOARD_ORIGIN_Y + i * CELL_SIZE
-		pygame.draw.line(screen, (0, 0, 0), (BOARD_ORIGIN_X, y), (BOARD_ORIGIN_X + CELL_SIZE * (BOARD_SIZE - 1), y))
+	# background, top bar and grid, drawn once per window size
+	screen.blit(cached_surface('board', build_board_surface), (0, 0))
 
 
 def draw_pieces():
-	grid = game.board.grid
-	for yy in range(BOARD_SIZE):
-		for xx in range(BOARD_SIZE):
-			if grid[yy][xx] != 0:
-				center = (int(BOARD_ORIGIN_X + xx * CELL_SIZE), int(BOARD_ORIGIN_Y + yy * CELL_SIZE))
-				color = (0, 0, 0) if grid[yy][xx] == 1 else (255, 255, 255)
-				pygame.draw.circle(screen, color, center, max(2, int(CELL_SIZE // 2 - 2)))
+	r = stone_radius()
+	sprites = {
+		1: cached_surface('black', lambda: circle_sprite((0, 0, 0), r)),
+		2: cached_surface('white', lambda: circle_sprite((255, 255, 255), r)),
+	}
+	clip = screen.get_clip()
+	for xx, yy, v in stones(game.board.grid):
+		if clip.colliderect(cell_rect((xx, yy))):
+			blit_centered(sprites[v], cell_center(xx, yy))
 
 
 def draw_highlights():
+	r = stone_radius()
 	# last move marker
 	if game.last_move:
-		lx, ly = game.last_move
-		center = (int(BOARD_ORIGIN_X + lx * CELL_SIZE), int(BOARD_ORIGIN_Y + ly * CELL_SIZE))
-		r = max(2, int(CELL_SIZE // 2 - 2))
-		pygame.draw.circle(screen, (0, 150, 255), center, r + 6, 3)
+		blit_centered(cached_surface('last move', lambda: circle_sprite((0, 150, 255), r + 6, 3)),
+					  cell_center(*game.last_move))
 
 	# hover preview (semi-transparent)
 	if hover_cell and mode == 'playing' and game.winner == 0:
-		hx, hy = hover_cell
-		center = (int(BOARD_ORIGIN_X + hx * CELL_SIZE), int(BOARD_ORIGIN_Y + hy * CELL_SIZE))
-		r = max(2, int(CELL_SIZE // 2 - 2))
-		s = pygame.Surface((r * 2 + 8, r * 2 + 8), pygame.SRCALPHA)
-		pygame.draw.circle(s, (0, 255, 0, 120), (r + 4, r + 4), r)
-		screen.blit(s, (center[0] - (r + 4), center[1] - (r + 4)))
+		blit_centered(cached_surface('hover', lambda: circle_sprite((0, 255, 0, 120), r, pad=4)),
+					  cell_center(*hover_cell))
 
 	# winning line highlight (if any)
 	if game.win_line:
+		ring = cached_surface('win', lambda: circle_sprite((255, 60, 60), r + 6, 4))
 		for (wx, wy) in game.win_line:
-			center = (int(BOARD_ORIGIN_X + wx * CELL_SIZE), int(BOARD_ORIGIN_Y + wy * CELL_SIZE))
-			r = max(2, int(CELL_SIZE // 2 - 2))
-			pygame.draw.circle(screen, (255, 60, 60), center, r + 6, 4)
+			blit_centered(ring, cell_center(wx, wy))
+
+
+def set_board_size(size):
+	"""Play on a size x size board from now on (a new, empty game)."""
+	global BOARD_SIZE, game
+	ai_worker.cancel()
+	BOARD_SIZE = size
+	game = Game(size)
+	update_layout(WINDOW_W, WINDOW_H)
 
 
 def reset_board(starting_player=1):
 	"""Reset core game state and switch to playing mode."""
+	ai_worker.cancel()
+	ai_worker.last_stats = None
 	game.reset(starting_player)
-	global mode
+	global mode, ai_error
 	mode = 'playing'
+	ai_error = None
 
 
 def start_game(as_player):
@@ -193,7 +270,7 @@ def start_game(as_player):
 
 def draw_menu():
 	screen.fill((40, 40, 60))
-	title = BIG_FONT.render('Gomoku', True, (255, 255, 255))
+	title = render_text(BIG_FONT, 'Gomoku', (255, 255, 255))
 	screen.blit(title, ((WINDOW_W - title.get_width()) // 2, 60))
 	# Buttons
 	b_w = 260
@@ -239,11 +316,15 @@ def draw_top_right():
 	return btns
 
 
-def draw_game_over():
-	# overlay
+def build_overlay():
 	s = pygame.Surface((WINDOW_W, WINDOW_H), pygame.SRCALPHA)
 	s.fill((0, 0, 0, 140))
-	screen.blit(s, (0, 0))
+	return s
+
+
+def draw_game_over():
+	# overlay
+	screen.blit(cached_surface('overlay', build_overlay), (0, 0))
 	# message
 	if game.winner == 0:
 		msg = 'Draw'
@@ -252,7 +333,7 @@ def draw_game_over():
 			msg = 'You win!'
 		else:
 			msg = 'You lose!'
-	txt = BIG_FONT.render(msg, True, (255, 255, 255))
+	txt = render_text(BIG_FONT, msg, (255, 255, 255))
 	rect = txt.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 - 30))
 	screen.blit(txt, rect)
 	# restart button
@@ -261,41 +342,99 @@ def draw_game_over():
 	return btn
 
 
-def draw_ai_thinking():
+def thinking_text():
+	"""Text of the "AI Thinking..." box (or the AI's error), or None when no search runs."""
+	if ai_error is not None:
+		return ai_error
+	if not ai_thinking:
+		return None
+	elapsed, nodes = ai_worker.progress()
+	think_text = f"AI Thinking... {elapsed:.1f}s"
+	if nodes:
+		think_text += f" / {nodes:,} nodes"
+	return think_text
+
+
+def thinking_rect(think_text):
+	text_width = FONT.size(think_text)[0]
+	return pygame.Rect((WINDOW_W - text_width) // 2 - 10, TOP_BAR + 10, text_width + 20, 40)
+
+
+def draw_ai_thinking(think_text):
 	# Display "AI Thinking..." at the top of the screen
-	if ai_thinking:
-		# Create a subtle background box
-		think_text = "AI Thinking..."
+	if think_text:
+		# the text changes every frame, so it is rendered directly rather than cached
 		txt = FONT.render(think_text, True, (255, 200, 100))
-		text_width = txt.get_width()
-		box_x = (WINDOW_W - text_width) // 2 - 10
-		box_y = TOP_BAR + 10
-		box_w = text_width + 20
-		box_h = 40
+		box = thinking_rect(think_text)
 		
 		# Semi-transparent background
-		s = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-		pygame.draw.rect(s, (0, 0, 0, 100), (0, 0, box_w, box_h))
-		pygame.draw.rect(s, (255, 200, 100), (0, 0, box_w, box_h), 2)
-		screen.blit(s, (box_x, box_y))
+		def build_box():
+			s = pygame.Surface(box.size, pygame.SRCALPHA)
+			pygame.draw.rect(s, (0, 0, 0, 100), (0, 0, box.w, box.h))
+			pygame.draw.rect(s, (255, 200, 100), (0, 0, box.w, box.h), 2)
+			return s
+		screen.blit(cached_surface(('thinking', box.w), build_box), box.topleft)
 		
 		# Draw text
-		screen.blit(txt, (box_x + 10, box_y + 7))
+		screen.blit(txt, (box.x + 10, box.y + 7))
+
+
+def draw_search_stats():
+	# Statistics of the AI's last search, at the top-left of the top bar
+	stats = ai_worker.last_stats
+	if not show_stats or stats is None:
+		return
+	txt = render_text(SMALL_FONT, stats.summary(), (230, 230, 230))
+	screen.blit(txt, (10, (TOP_BAR - txt.get_height()) // 2))
+
+
+def scene_state():
+	"""Everything a frame shows except the hover preview and the AI progress text."""
+	stats = ai_worker.last_stats if show_stats else None
+	return (mode, menu_step, WINDOW_W, WINDOW_H, tuple(map(tuple, game.board.grid)), game.last_move,
+			game.win_line and tuple(game.win_line), game.winner, ai_thinking, stats and stats.summary())
 
 
 # -----------------
 # Main
 # -----------------
-def main():
+def main(size=None):
+	global AI_PLAYER, winner, current_player, mode, screen, vs_ai, menu_step, hover_cell, ai_type, ai_thinking
+	global show_stats, ponder, ai_error
+	screen = pygame.display.set_mode((WINDOW_W, WINDOW_H), pygame.RESIZABLE | pygame.SWSURFACE)
+	pygame.display.set_caption("Gomoku")
+	if size is not None and size != BOARD_SIZE:
+		set_board_size(size)
 	update_layout(WINDOW_W, WINDOW_H)
 	menu_buttons = ()
 	in_top_buttons = []
 	gameover_restart = None
-	global AI_PLAYER, winner, current_player, mode, screen, vs_ai, menu_step, hover_cell, ai_type, ai_thinking
+	# what is on screen now; a changed scene is redrawn in full, hover and progress text changes as dirty rects
+	drawn_scene = drawn_hover = drawn_thinking = None
+	idle = False
+
+	def draw_frame(think_text):
+		nonlocal menu_buttons, in_top_buttons, gameover_restart
+		if mode == 'menu':
+			menu_buttons = draw_menu()
+		else:
+			draw_board()
+			draw_pieces()
+			draw_highlights()
+			in_top_buttons = draw_top_right()
+			draw_search_stats()
+			if mode == 'game_over':
+				gameover_restart = draw_game_over()
+			else:
+				# Only show AI thinking indicator during gameplay
+				draw_ai_thinking(think_text)
 
 	while True:
-		for event in pygame.event.get():
+		# with nothing to animate or poll, sleep until the next event instead of spinning at 60 fps
+		events = [pygame.event.wait()] + pygame.event.get() if idle else pygame.event.get()
+		for event in events:
 			if event.type == pygame.QUIT:
+				ai_worker.cancel()
 				pygame.quit()
 				sys.exit()
 
@@ -303,6 +442,10 @@ def main():
 				# handle window resize
 				update_layout(event.w, event.h)
 				screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE | pygame.SWSURFACE)
+				drawn_scene = None
+
+			if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+				drawn_scene = None  # window contents were lost
 				
 			if mode == 'menu':
 				if event.type == pygame.MOUSEBUTTONDOWN:
@@ -352,6 +495,7 @@ def main():
 							if b.text == 'Restart':
 								reset_board(starting_player=1)
 							elif b.text == 'Menu':
+								ai_worker.cancel()
 								mode = 'menu'
 								menu_step = 'choose_mode'
 								vs_ai = False
@@ -367,18 +511,27 @@ def main():
 								if placed:
 									# prevent extra mouse events causing multiple placements
 									pygame.event.clear(pygame.MOUSEBUTTONDOWN)
-									if won:
+									if won or game.is_full():
+										ai_worker.cancel()  # stop pondering replies that will never come
 										mode = 'game_over'
 
 				if event.type == pygame.KEYDOWN:
 					if event.key == pygame.K_a:
 						# toggle AI for opponent
+						ai_worker.cancel()
 						if AI_PLAYER is None:
 							AI_PLAYER = 3 - human_player
 							print('Random AI enabled')
 						else:
 							AI_PLAYER = None
 							print('Random AI disabled')
+					elif event.key == pygame.K_s:
+						show_stats = not show_stats
+					elif event.key == pygame.K_p:
+						ponder = not ponder
+						if ai_worker.pondering:
+							ai_worker.cancel()
+						print('Pondering enabled' if ponder else 'Pondering disabled')
 
 			elif mode == 'game_over':
 				if event.type == pygame.MOUSEBUTTONDOWN:
@@ -386,50 +539,58 @@ def main():
 					if gameover_restart and gameover_restart.collidepoint((mx, my)):
 						reset_board(starting_player=1)
 
-		# AI move handling
-		if mode == 'playing' and game.winner == 0 and AI_PLAYER is not None and game.current_player == AI_PLAYER:
-			ai_thinking = True  # Set flag to show "AI Thinking..."
-			# Render frame to show thinking indicator
-			draw_board()
-			draw_pieces()
-			draw_highlights()
-			draw_ai_thinking()
+		# AI move handling: the search runs in a background process, polled each frame
+		if (mode == 'playing' and game.winner == 0 and AI_PLAYER is not None and game.current_player == AI_PLAYER
+				and not game.is_full() and ai_error is None):
+			if not ai_worker.busy:
+				ai_worker.start(ai_type, game.board.grid, game.current_player)
+			else:
+				finished, move = ai_worker.poll()
+				if finished and ai_worker.last_error is not None:
+					print(ai_worker.last_error, file=sys.stderr)
+					ai_error = 'AI error (see console)'
+				elif finished and move:
+					x, y = move
+					placed, won = game.play_move(x, y)
+					if not placed:
+						print(f'AI move {move} was refused', file=sys.stderr)
+						ai_error = f'AI move {move} refused'
+					elif won or game.is_full():
+						mode = 'game_over'
+				elif finished:
+					mode = 'game_over'  # no legal move left for the AI
+		if (mode == 'playing' and game.winner == 0 and AI_PLAYER is not None and game.current_player != AI_PLAYER
+				and ponder and ai_type != 'random' and not ai_worker.pondering and not game.is_full()):
+			# human to move: search the AI's answers to their likely replies meanwhile
+			ai_worker.ponder(ai_type, game.board.grid, AI_PLAYER)
+		ai_thinking = ai_worker.busy  # show "AI Thinking..." while a search runs
+
+		# Drawing: only what changed since the last frame
+		scene = scene_state()
+		hover = hover_cell if mode == 'playing' and game.winner == 0 else None
+		think_text = thinking_text() if mode == 'playing' else None
+		if scene != drawn_scene:
+			draw_frame(think_text)
 			pygame.display.flip()
-			pygame.time.wait(200)  # Wait before AI computation to show indicator
-			
-			# choose AI based on selected type
-			if ai_type == 'alpha_beta':
-				move = alpha_beta_ai.get_move(game.board.grid, game.current_player)
-			elif ai_type == 'alpha_beta_plus':
-				move = alpha_beta_plus_ai.get_move(game.board.grid, game.current_player)
-			else:  # 'random'
-				move = random_ai.get_move(game.board.grid, game.current_player)
-			ai_thinking = False  # Clear flag after AI thinks
-			if move:
-				x, y = move
-				placed, won = game.play_move(x, y)
-				# clear mouse events which might have accumulated
-				pygame.event.clear(pygame.MOUSEBUTTONDOWN)
-				if won:
-					mode = 'game_over'
-			pygame.time.wait(150)
-
-		# Drawing
-		if mode == 'menu':
-			menu_buttons = draw_menu()
 		else:
-			draw_board()
-			draw_pieces()
-			draw_highlights()
-			in_top_buttons = draw_top_right()
-			if mode == 'game_over':
-				gameover_restart = draw_game_over()
-			else:
-				# Only show AI thinking indicator during gameplay
-				draw_ai_thinking()
-		pygame.display.flip()
+			dirty = [cell_rect(c) for c in {drawn_hover, hover} - {None} if hover != drawn_hover]
+			if think_text != drawn_thinking:
+				dirty += [thinking_rect(t) for t in (drawn_thinking, think_text) if t]
+			for rect in dirty:
+				screen.set_clip(rect)
+				draw_frame(think_text)
+			screen.set_clip(None)
+			if dirty:
+				pygame.display.update(dirty)
+		drawn_scene, drawn_hover, drawn_thinking = scene, hover, think_text
+		idle = not ai_worker.busy
 		clock.tick(60)
 
 
 if __name__ == '__main__':
-	main()
\ No newline at end of file
+	parser = argparse.ArgumentParser(description='Gomoku local gui')
+	parser.add_argument('--size', type=int, default=BOARD_SIZE, help='board size, e.g. 19')
+	args = parser.parse_args()
+	if not 5 <= args.size <= 50:
+		parser.error('size must be between 5 and 50')
+	main(args.size)
\ No newline at end of file